@@ -0,0 +1,261 @@
+"""
+Headless ScatterCraft benchmark.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/scatter_benchmark.py -- --output results.json
+
+Builds synthetic targets (subdivided planes, box volumes and long Bezier
+paths), runs Execute Scatter over every combination of method, density
+and overlap avoidance, and reports throughput, memory and time to first
+instance as JSON. Pass --quick for a smoke run.
+
+Each case runs in a fresh background Blender, so its peak RSS isn't
+inflated by the cases before it.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import bpy
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, peak RSS is reported as null there
+    resource = None
+
+# Import the add-on straight from this checkout
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import kodelabz_toolkit
+from kodelabz_toolkit.tools import scatter_craft
+
+# Side length of the target planes, the area sets the instance count
+PLANE_SIZE = 100.0
+
+# Edge length of the volume box
+VOLUME_SIZE = 20.0
+
+# Length and point count of the benchmark path
+PATH_LENGTH = 5000.0
+PATH_POINTS = 200
+
+# Prefix of the line a case process prints its record on
+CASE_MARKER = "KDLZ_BENCH_CASE "
+
+def parse_args():
+    """Parse the arguments after Blender's `--` separator"""
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    
+    parser = argparse.ArgumentParser(description="Benchmark ScatterCraft in background mode")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--methods", nargs="+", default=["SURFACE", "VOLUME", "PATH"],
+                        choices=["SURFACE", "VOLUME", "PATH"])
+    parser.add_argument("--faces", nargs="+", type=int, default=[1000, 10000, 100000, 1000000],
+                        help="Face counts of the surface target planes")
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.01, 0.1, 1.0])
+    parser.add_argument("--output-modes", nargs="+", default=["OBJECTS"], choices=["OBJECTS", "POINTS"])
+    parser.add_argument("--min-distance", type=float, default=0.5)
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Track peak Python and NumPy allocations per case (slows the run down)")
+    parser.add_argument("--quick", action="store_true", help="Small targets and densities only")
+    parser.add_argument("--case", help="Run one case given as JSON and print its record (used internally)")
+    
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.faces = [1000, 10000]
+        args.densities = [0.01, 0.1]
+    return args
+
+def peak_rss_mb():
+    """Process memory high-water mark since it started, in megabytes"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def build_plane(faces):
+    """Grid plane with roughly `faces` quads"""
+    segments = max(int(round(math.sqrt(faces))), 1)
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=segments, y_subdivisions=segments, size=PLANE_SIZE)
+    plane = bpy.context.active_object
+    plane.name = f"KDLZ_Bench_Plane_{faces}"
+    return plane
+
+def build_path():
+    """Long zig-zag Bezier curve"""
+    curve = bpy.data.curves.new("KDLZ_Bench_Path", 'CURVE')
+    curve.dimensions = '3D'
+    spline = curve.splines.new('BEZIER')
+    spline.bezier_points.add(PATH_POINTS - 1)
+    
+    step = PATH_LENGTH / (PATH_POINTS - 1)
+    for index, point in enumerate(spline.bezier_points):
+        point.co = (index * step, (index % 2) * step, 0.0)
+        point.handle_left_type = 'AUTO'
+        point.handle_right_type = 'AUTO'
+    
+    path = bpy.data.objects.new("KDLZ_Bench_Path", curve)
+    bpy.context.scene.collection.objects.link(path)
+    return path
+
+def build_item_object():
+    """Small mesh to scatter, kept out of the scene"""
+    mesh = bpy.data.meshes.new("KDLZ_Bench_Item")
+    mesh.from_pydata([(0, 0, 0), (0.1, 0, 0), (0, 0.1, 0), (0, 0, 0.1)], [], [(0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)])
+    return bpy.data.objects.new("KDLZ_Bench_Item", mesh)
+
+def run_case(scene, case, trace_memory):
+    """Run one scatter and collect its timings"""
+    props = scene.kdlz_scatter_props
+    bpy.ops.kdlz.clear_scatter()
+    
+    # Every case starts from a cold sampling table
+    scatter_craft.clear_scatter_caches()
+    scatter_craft.last_scatter_stats.clear()
+    
+    props.scatter_method = case["method"]
+    props.output_mode = case["output_mode"]
+    props.avoid_overlap = case["avoid_overlap"]
+    props.scatter_items[0].density = case["density"]
+    
+    if trace_memory:
+        tracemalloc.start()
+    
+    # Blender, the add-on and the target are already in memory here
+    baseline_rss = peak_rss_mb()
+    started = time.perf_counter()
+    result = bpy.ops.kdlz.execute_scatter()
+    elapsed = time.perf_counter() - started
+    
+    record = dict(case)
+    if trace_memory:
+        record["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    
+    stats = dict(scatter_craft.last_scatter_stats)
+    record.update(
+        status=sorted(result)[0],
+        wall_seconds=elapsed,
+        instances=stats.get("instances", 0),
+        instances_per_second=stats.get("instances", 0) / elapsed if elapsed > 0 else None,
+        generate_seconds=stats.get("generate_seconds"),
+        first_instance_seconds=stats.get("first_instance_seconds"),
+        baseline_rss_mb=baseline_rss,
+        peak_rss_mb=peak_rss_mb()
+    )
+    return record
+
+def setup_scene(args):
+    """Empty scene with the add-on registered and one scatter item"""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    if not hasattr(bpy.types.Scene, "kdlz_scatter_props"):
+        kodelabz_toolkit.register()
+    
+    scene = bpy.context.scene
+    props = scene.kdlz_scatter_props
+    props.min_distance = args.min_distance
+    props.volume_size = (VOLUME_SIZE, VOLUME_SIZE, VOLUME_SIZE)
+    props.volume_center = (0.0, 0.0, 0.0)
+    
+    item = props.scatter_items.add()
+    item.object = build_item_object()
+    item.random_seed = 1
+    return scene
+
+def run_case_here(args):
+    """Build the case's target in this process, run it and print its record"""
+    case = json.loads(args.case)
+    scene = setup_scene(args)
+    props = scene.kdlz_scatter_props
+    
+    if case["method"] == 'SURFACE':
+        plane = build_plane(case["faces"])
+        props.target_object = plane.name
+        case["target_faces"] = len(plane.data.polygons)
+    elif case["method"] == 'PATH':
+        props.path_object = build_path().name
+        case["path_length"] = PATH_LENGTH
+    else:
+        case["volume_size"] = VOLUME_SIZE
+    
+    record = run_case(scene, case, args.trace_memory)
+    print(CASE_MARKER + json.dumps(record))
+
+def run_case_process(args, case):
+    """Run one case in a fresh background Blender and return its record"""
+    command = [
+        bpy.app.binary_path, "-b", "--factory-startup", "--python", os.path.abspath(__file__), "--",
+        "--case", json.dumps(case), "--min-distance", str(args.min_distance)
+    ]
+    if args.trace_memory:
+        command.append("--trace-memory")
+    
+    completed = subprocess.run(command, capture_output=True, text=True)
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(CASE_MARKER):
+            return json.loads(line[len(CASE_MARKER):])
+    
+    # The case process crashed before printing its record
+    record = dict(case, status="CRASHED", instances=0, wall_seconds=None)
+    record["error"] = (completed.stderr or completed.stdout).strip()[-2000:]
+    return record
+
+def main():
+    args = parse_args()
+    if args.case:
+        run_case_here(args)
+        return
+    
+    # One target per method, and one plane per face count
+    targets = []
+    for method in args.methods:
+        if method == 'SURFACE':
+            for faces in args.faces:
+                targets.append(dict(method=method, faces=faces))
+        else:
+            targets.append(dict(method=method))
+    
+    cases = []
+    for target in targets:
+        for output_mode in args.output_modes:
+            for density in args.densities:
+                for avoid_overlap in (False, True):
+                    case = dict(target, output_mode=output_mode, density=density, avoid_overlap=avoid_overlap)
+                    record = run_case_process(args, case)
+                    cases.append(record)
+                    wall = f"{record['wall_seconds']:.3f}s" if record["wall_seconds"] is not None else record["status"]
+                    print(f"{case['method']:8} {output_mode:8} density={density:<6} overlap={avoid_overlap!s:5} "
+                          f"{record['instances']:>8} instances in {wall}", file=sys.stderr)
+    
+    report = {
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "min_distance": args.min_distance,
+        # Peak RSS is per case process: baseline before the scatter, peak after it
+        "rss_units": "MiB",
+        "cases": cases
+    }
+    
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"Benchmark report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,19 @@ bl_info = {
     "category": "3D View",
 }
 
-import bpy
-from . import kodelabz_dashboard
-from . import preferences
-from .tools import ai_texture_lab, auto_mesh_pro, scatter_craft
+try:
+    import bpy
+except ImportError:
+    # Imported outside Blender, e.g. by ScatterCraft worker processes that
+    # only need the bpy-free helpers in tools.scatter_sampling
+    bpy = None
 
-modules = [kodelabz_dashboard, preferences, ai_texture_lab, auto_mesh_pro, scatter_craft]
+if bpy is not None:
+    from . import kodelabz_dashboard
+    from . import preferences
+    from .tools import ai_texture_lab, auto_mesh_pro, scatter_craft
+    
+    modules = [kodelabz_dashboard, preferences, ai_texture_lab, auto_mesh_pro, scatter_craft]
 
 def register():
     for mod in modules:
@@ -1,5 +1,12 @@
-from . import ai_texture_lab
-from . import auto_mesh_pro
-from . import scatter_craft
+try:
+    import bpy
+except ImportError:
+    # Worker processes import scatter_sampling without Blender
+    bpy = None
+
+if bpy is not None:
+    from . import ai_texture_lab
+    from . import auto_mesh_pro
+    from . import scatter_craft
 
 __all__ = ['ai_texture_lab', 'auto_mesh_pro', 'scatter_craft']
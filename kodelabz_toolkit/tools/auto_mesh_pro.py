@@ -1,5 +1,272 @@
 import bpy
-from bpy.props import FloatProperty, BoolProperty, EnumProperty, IntProperty, StringProperty
+import bmesh
+import time
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import FloatProperty, BoolProperty, EnumProperty, IntProperty, StringProperty, PointerProperty
+
+from .mesh_analysis import analyze_mesh, coincident_vertex_count
+
+# Summary of the last batch run, shown in the panel
+last_batch_report = {"label": "", "done": 0, "timings": [], "failures": [], "shared": 0.0}
+
+# Health reports per mesh pointer, dropped when the mesh's geometry changes
+_mesh_reports = {}
+
+def gather_vertex_positions(mesh):
+    """Read vertex positions in bulk"""
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    return verts.reshape(-1, 3).astype(np.float64)
+
+def gather_mesh_buffers(mesh):
+    """Read vertex positions, edges and polygon loops in bulk for analyze_mesh"""
+    verts = gather_vertex_positions(mesh)
+    
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    
+    return verts, edges.reshape(-1, 2), loop_starts, loop_totals, loop_verts, loop_edges
+
+def mesh_counts(mesh):
+    """Element counts, guard against a freed mesh's pointer being reused"""
+    return (len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops))
+
+def cached_mesh_report(mesh):
+    """Health report of a mesh if one is cached and still current, else None"""
+    cached = _mesh_reports.get(mesh.as_pointer())
+    if cached is None or cached[0] != mesh_counts(mesh):
+        return None
+    return cached[1]
+
+def get_mesh_report(mesh):
+    """Health report of a mesh, analyzed again only after its geometry changed"""
+    report = cached_mesh_report(mesh)
+    if report is None:
+        report = analyze_mesh(*gather_mesh_buffers(mesh))
+        _mesh_reports[mesh.as_pointer()] = (mesh_counts(mesh), report)
+    return report
+
+@persistent
+def invalidate_mesh_reports(scene, depsgraph=None):
+    """Drop the reports of meshes whose geometry was edited"""
+    if not _mesh_reports or depsgraph is None:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            _mesh_reports.pop(data.as_pointer(), None)
+
+@persistent
+def clear_mesh_reports(dummy=None):
+    """Forget every report, pointers are meaningless in a new file"""
+    _mesh_reports.clear()
+
+def draw_mesh_report(layout, obj):
+    """Draw the active mesh's cached health report, analyzing is left to Analyze Mesh"""
+    col = layout.column(align=True)
+    if obj.mode == 'EDIT':
+        # Edit-mode changes only reach the mesh on leaving edit mode
+        col.label(text="Leave Edit Mode to analyze the mesh", icon="INFO")
+        return
+    
+    col.operator("kdlz.analyze_mesh", icon="VIEWZOOM")
+    report = cached_mesh_report(obj.data)
+    if report is None:
+        return
+    
+    if report["watertight"]:
+        col.label(text=f"Watertight, volume {report['volume']:.4g}", icon="CHECKMARK")
+    else:
+        col.label(text=f"Not watertight: {report['non_manifold_edges']} non-manifold edges", icon="ERROR")
+        col.label(text=f"Boundary loops: {report['boundary_loops']}, wire: {report['wire_edges']}, fins: {report['multi_face_edges']}")
+    
+    col.label(text=f"Parts: {report['loose_parts']}, loose vertices: {report['loose_vertices']}")
+    col.label(text=f"Zero-area faces: {report['zero_area_faces']}")
+    if report["inside_out"]:
+        col.label(text="Normals point inward", icon="ERROR")
+    else:
+        col.label(text=f"Flipped edges: {report['flipped_edges']}")
+    col.label(text=f"Triangles: {report['triangles']}, area {report['area']:.4g}")
+
+def get_automesh_targets(context, props):
+    """Mesh objects the AutoMesh operators act on, per the Process setting"""
+    if props.batch_target == 'SELECTED':
+        objects = context.selected_objects
+    elif props.batch_target == 'COLLECTION':
+        objects = props.batch_collection.all_objects if props.batch_collection else []
+    else:
+        objects = [context.active_object] if context.active_object else []
+    
+    # Operators need objects they can select and edit in this view layer
+    view_layer_objects = context.view_layer.objects
+    return [
+        obj for obj in objects
+        if obj.type == 'MESH' and view_layer_objects.get(obj.name) == obj and obj.visible_get()
+    ]
+
+def ensure_object_mode(context):
+    """Leave edit (or any other) mode so object-level operators can run"""
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+def select_only(context, objects, active=None):
+    """Make `objects` the selection, with `active` (default the first) active"""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    if active or objects:
+        context.view_layer.objects.active = active or objects[0]
+
+def evaluated_copy(obj, depsgraph, suffix):
+    """Copy of `obj` with its modifiers applied, linked next to the original"""
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+    copy = obj.copy()
+    copy.modifiers.clear()
+    copy.data = mesh
+    copy.name = mesh.name = obj.name + suffix
+    for collection in obj.users_collection:
+        collection.objects.link(copy)
+    return copy
+
+def discard_copy(obj):
+    """Remove a copy made by evaluated_copy along with its mesh"""
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+def apply_modifier(context, obj, modifier_type, **settings):
+    """Add a modifier to `obj` with `settings` and apply it right away"""
+    modifier = obj.modifiers.new(modifier_type.title(), modifier_type)
+    for name, value in settings.items():
+        setattr(modifier, name, value)
+    context.view_layer.objects.active = obj
+    bpy.ops.object.modifier_apply(modifier=modifier.name)
+
+# Largest hole, in edges, that cleanup fills (the Fill Holes operator default)
+FILL_HOLE_SIDES = 4
+
+def cleanup_mesh(mesh, merge_distance=None, fill_holes=False, recalculate_normals=False, delete_loose=False, triangulate=False):
+    """Run the cleanup stages on one bmesh and write the mesh back once.
+    
+    Works on object-mode mesh data, so the owning objects must not be in
+    edit mode.
+    """
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        
+        if merge_distance is not None:
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+        
+        if fill_holes:
+            bmesh.ops.holes_fill(bm, edges=bm.edges, sides=FILL_HOLE_SIDES)
+        
+        if recalculate_normals:
+            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        
+        if delete_loose:
+            # Edges without faces, then vertices without edges
+            bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if not edge.link_faces], context='EDGES')
+            bmesh.ops.delete(bm, geom=[vert for vert in bm.verts if not vert.link_edges], context='VERTS')
+        
+        if triangulate:
+            bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method='BEAUTY', ngon_method='BEAUTY')
+        
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+
+def cleanup_objects(objects, **stages):
+    """Clean every object's mesh, once per mesh shared by linked duplicates.
+    
+    Returns run_batch's results, timings and failures.
+    """
+    cleaned = set()
+    
+    def process(obj):
+        if obj.data.as_pointer() not in cleaned:
+            cleanup_mesh(obj.data, **stages)
+            cleaned.add(obj.data.as_pointer())
+        return obj
+    
+    return run_batch(objects, process)
+
+def run_in_edit_mode(context, objects, steps):
+    """Call `steps()` once with every object in one multi-object edit session.
+    
+    Returns the seconds spent, including entering and leaving edit mode.
+    """
+    started = time.perf_counter()
+    ensure_object_mode(context)
+    select_only(context, objects)
+    bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        steps()
+    finally:
+        bpy.ops.object.mode_set(mode='OBJECT')
+    return time.perf_counter() - started
+
+def run_batch(objects, process):
+    """Call `process(obj)` for every object, timing each one.
+    
+    Operator failures on one object don't stop the batch. Returns the
+    results, (name, seconds) timings and (name, message) failures.
+    """
+    results = []
+    timings = []
+    failures = []
+    for obj in objects:
+        name = obj.name
+        started = time.perf_counter()
+        try:
+            results.append(process(obj))
+        except RuntimeError as e:
+            failures.append((name, str(e).strip()))
+        else:
+            timings.append((name, time.perf_counter() - started))
+    return results, timings, failures
+
+def report_batch(operator, label, done, timings, failures, shared=0.0, details=""):
+    """Report one summary for a batch run and keep the details for the panel.
+    
+    `done` counts the objects processed. `shared` is time spent on all of
+    them at once, e.g. in a common edit session, that can't be attributed
+    to a single object. `details` is appended to the summary.
+    """
+    last_batch_report.update(label=label, done=done, timings=timings, failures=failures, shared=shared)
+    
+    total = sum(seconds for name, seconds in timings) + shared
+    summary = f"{label}: {done} object(s) in {total:.2f}s"
+    if len(timings) > 1:
+        name, seconds = max(timings, key=lambda timing: timing[1])
+        summary += f", slowest {name} ({seconds:.2f}s)"
+    if details:
+        summary += f", {details}"
+    
+    if failures:
+        operator.report({'WARNING'}, summary + f", {len(failures)} failed: " + ", ".join(name for name, message in failures))
+        for name, message in failures:
+            operator.report({'WARNING'}, f"{name}: {message}")
+    else:
+        operator.report({'INFO'}, summary)
 
 class KDLZ_PT_AutoMeshProPanel(bpy.types.Panel):
     bl_label = "AutoMesh Pro"
@@ -13,15 +280,40 @@ class KDLZ_PT_AutoMeshProPanel(bpy.types.Panel):
         layout = self.layout
         props = context.scene.kdlz_automesh_props
         
+        # Batch targets
+        box = layout.box()
+        box.label(text="Process", icon="OUTLINER_OB_GROUP_INSTANCE")
+        
+        col = box.column(align=True)
+        row = col.row(align=True)
+        row.prop(props, "batch_target", expand=True)
+        if props.batch_target == 'COLLECTION':
+            col.prop(props, "batch_collection")
+        
         # Check if an object is selected
-        if not context.active_object or context.active_object.type != 'MESH':
+        if props.batch_target == 'ACTIVE' and (not context.active_object or context.active_object.type != 'MESH'):
             layout.label(text="Select a mesh object", icon="ERROR")
             return
         
+        # Last batch run
+        if last_batch_report["label"] and props.batch_target != 'ACTIVE':
+            col = box.column(align=True)
+            failures = last_batch_report["failures"]
+            col.label(text=f"{last_batch_report['label']}: {last_batch_report['done']} done, {len(failures)} failed", icon="INFO")
+            slowest = sorted(last_batch_report["timings"], key=lambda timing: timing[1], reverse=True)
+            for name, seconds in slowest[:3]:
+                col.label(text=f"{name}: {seconds:.2f}s", icon="SORTTIME")
+            for name, message in failures[:5]:
+                col.label(text=f"{name}: {message}", icon="ERROR")
+            if len(failures) > 5:
+                col.label(text=f"...and {len(failures) - 5} more, see the Info log")
+        
         # Quick Actions
         box = layout.box()
         box.label(text="Quick Actions", icon="PLAY")
         
+        box.prop(props, "target_triangles")
+        
         row = box.row(align=True)
         row.scale_y = 1.5
         row.operator("kdlz.auto_optimize_mesh", icon="SHADERFX")
@@ -104,6 +396,11 @@ class KDLZ_PT_AutoMeshProPanel(bpy.types.Panel):
         col.prop(props, "intersect_cleanup")
         col.prop(props, "check_watertight")
         
+        # Health report of the active mesh
+        if props.check_watertight and context.active_object and context.active_object.type == 'MESH':
+            draw_mesh_report(box, context.active_object)
+        
+        col = box.column(align=True)
         col.separator()
         row = col.row(align=True)
         row.scale_y = 1.2
@@ -134,29 +431,12 @@ class KDLZ_OT_AutoMeshPro(bpy.types.Operator):
         bpy.context.space_data.context = 'VIEW_3D'
         return {'FINISHED'}
 
-class KDLZ_OT_ApplyRetopology(bpy.types.Operator):
-    bl_idname = "kdlz.apply_remesh"
-    bl_label = "Apply Remesh"
+def remesh_object(context, obj, props, depsgraph):
+    """Remesh a modifier-applied copy of `obj` and return the copy"""
+    retopo_obj = evaluated_copy(obj, depsgraph, "_remeshed")
+    context.view_layer.objects.active = retopo_obj
     
-    def execute(self, context):
-        props = context.scene.kdlz_automesh_props
-        obj = context.active_object
-        
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "No mesh object selected")
-            return {'CANCELLED'}
-        
-        # Store original object
-        original_obj = obj
-        
-        # Make a copy of the object for retopology
-        bpy.ops.object.duplicate()
-        retopo_obj = context.active_object
-        
-        # Apply modifiers to ensure clean mesh
-        for modifier in retopo_obj.modifiers:
-            bpy.ops.object.modifier_apply(modifier=modifier.name)
-        
+    try:
         # Apply retopology based on method
         if props.remesh_method == 'VOXEL':
             # Voxel remesh
@@ -164,7 +444,7 @@ class KDLZ_OT_ApplyRetopology(bpy.types.Operator):
             retopo_obj.data.remesh_voxel_adaptivity = props.voxel_adaptivity
             retopo_obj.data.remesh_preserve_volume = props.voxel_preserve_volume
             bpy.ops.object.voxel_remesh()
-            
+        
         elif props.remesh_method == 'QUAD':
             # Quad remesh
             bpy.ops.object.quadriflow_remesh(
@@ -173,30 +453,79 @@ class KDLZ_OT_ApplyRetopology(bpy.types.Operator):
                 preserve_boundary=props.quad_preserve_mesh_boundary,
                 preserve_paint_mask=props.quad_preserve_paint_mask
             )
-            
+        
         elif props.remesh_method == 'DECIMATE':
             # Decimate
-            bpy.ops.object.modifier_add(type='DECIMATE')
-            retopo_obj.modifiers["Decimate"].ratio = props.decimate_ratio
-            
+            settings = dict(ratio=props.decimate_ratio)
             if props.decimate_use_symmetry:
-                retopo_obj.modifiers["Decimate"].use_symmetry = True
-                retopo_obj.modifiers["Decimate"].symmetry_axis = props.decimate_symmetry_axis
-                
-            bpy.ops.object.modifier_apply(modifier="Decimate")
+                settings.update(use_symmetry=True, symmetry_axis=props.decimate_symmetry_axis)
+            apply_modifier(context, retopo_obj, 'DECIMATE', **settings)
         
         elif props.remesh_method == 'SMOOTH':
             # Smooth
-            bpy.ops.object.modifier_add(type='SMOOTH')
-            retopo_obj.modifiers["Smooth"].factor = props.smooth_factor
-            retopo_obj.modifiers["Smooth"].iterations = props.smooth_iterations
-            bpy.ops.object.modifier_apply(modifier="Smooth")
+            apply_modifier(context, retopo_obj, 'SMOOTH', factor=props.smooth_factor, iterations=props.smooth_iterations)
+    except RuntimeError:
+        # Don't leave a half-processed copy behind
+        discard_copy(retopo_obj)
+        raise
+    
+    return retopo_obj
+
+class KDLZ_OT_ApplyRetopology(bpy.types.Operator):
+    bl_idname = "kdlz.apply_remesh"
+    bl_label = "Apply Remesh"
+    
+    def execute(self, context):
+        props = context.scene.kdlz_automesh_props
+        objects = get_automesh_targets(context, props)
+        
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects to process")
+            return {'CANCELLED'}
         
-        # Rename the retopologized object
-        retopo_obj.name = original_obj.name + "_remeshed"
+        ensure_object_mode(context)
         
-        self.report({'INFO'}, f"Remesh applied: {retopo_obj.name}")
-        return {'FINISHED'}
+        # One evaluation of the scene serves every copy
+        depsgraph = context.evaluated_depsgraph_get()
+        results, timings, failures = run_batch(objects, lambda obj: remesh_object(context, obj, props, depsgraph))
+        
+        if results:
+            select_only(context, results)
+        report_batch(self, "Remesh", len(results), timings, failures)
+        return {'FINISHED'} if results else {'CANCELLED'}
+
+# Merge distance used by Auto-Optimize
+AUTO_MERGE_DISTANCE = 0.001
+
+# Summary names of the cleanup_mesh stages
+CLEANUP_STAGE_LABELS = {
+    "merge_distance": "merge",
+    "fill_holes": "fill holes",
+    "recalculate_normals": "normals",
+    "delete_loose": "delete loose"
+}
+
+def plan_cleanup(report, coincident):
+    """Cleanup stages a mesh actually needs, as cleanup_mesh arguments.
+    
+    `report` is the mesh's health report and `coincident` its
+    coincident_vertex_count at AUTO_MERGE_DISTANCE.
+    """
+    stages = {}
+    if coincident:
+        stages["merge_distance"] = AUTO_MERGE_DISTANCE
+    
+    # Merging only closes boundaries, so no rim now means no hole after it
+    if report["boundary_loops"]:
+        stages["fill_holes"] = True
+    
+    # Merged seams can join faces wound the other way
+    if report["flipped_edges"] or report["inside_out"] or coincident:
+        stages["recalculate_normals"] = True
+    
+    if report["wire_edges"] or report["loose_vertices"]:
+        stages["delete_loose"] = True
+    return stages
 
 class KDLZ_OT_AutoOptimizeMesh(bpy.types.Operator):
     bl_idname = "kdlz.auto_optimize_mesh"
@@ -204,65 +533,64 @@ class KDLZ_OT_AutoOptimizeMesh(bpy.types.Operator):
     
     def execute(self, context):
         props = context.scene.kdlz_automesh_props
-        obj = context.active_object
+        objects = get_automesh_targets(context, props)
         
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "No mesh object selected")
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects to process")
             return {'CANCELLED'}
         
-        # Store original object
-        original_obj = obj
-        
-        # Make a copy of the object
-        bpy.ops.object.duplicate()
-        optimized_obj = context.active_object
-        
-        # Apply modifiers to ensure clean mesh
-        for modifier in optimized_obj.modifiers:
-            bpy.ops.object.modifier_apply(modifier=modifier.name)
-        
-        # Step 1: Remesh if needed (for high-poly meshes)
-        if len(optimized_obj.data.vertices) > 100000:
-            # Apply decimate to reduce complexity
-            bpy.ops.object.modifier_add(type='DECIMATE')
-            optimized_obj.modifiers["Decimate"].ratio = 0.5
-            bpy.ops.object.modifier_apply(modifier="Decimate")
-        
-        # Step 2: Clean up mesh
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all vertices
-        bpy.ops.mesh.select_all(action='SELECT')
-        
-        # Merge vertices
-        bpy.ops.mesh.remove_doubles(threshold=0.001)
-        
-        # Fix non-manifold
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.fill_holes()
+        ensure_object_mode(context)
+        depsgraph = context.evaluated_depsgraph_get()
         
-        # Recalculate normals
-        bpy.ops.mesh.normals_make_consistent(inside=False)
+        # How often each stage had to run, for the summary
+        stage_counts = dict.fromkeys(["decimate", *CLEANUP_STAGE_LABELS.values(), "unwrap"], 0)
         
-        # Remove loose geometry
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.delete_loose()
-        
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        def prepare(obj):
+            # Make a modifier-applied copy of the object
+            optimized_obj = evaluated_copy(obj, depsgraph, "_optimized")
+            mesh = optimized_obj.data
+            
+            try:
+                # Step 1: Decimate down to the triangle budget
+                report = get_mesh_report(mesh)
+                if props.target_triangles and report["triangles"] > props.target_triangles:
+                    apply_modifier(context, optimized_obj, 'DECIMATE', ratio=props.target_triangles / report["triangles"])
+                    stage_counts["decimate"] += 1
+                    report = get_mesh_report(mesh)
+                
+                # Step 2: Run only the cleanup stages the analysis calls for
+                stages = plan_cleanup(report, coincident_vertex_count(gather_vertex_positions(mesh), AUTO_MERGE_DISTANCE))
+                if stages:
+                    cleanup_mesh(mesh, **stages)
+                for stage in stages:
+                    stage_counts[CLEANUP_STAGE_LABELS[stage]] += 1
+            except RuntimeError:
+                discard_copy(optimized_obj)
+                raise
+            return optimized_obj
+        
+        optimized, timings, failures = run_batch(objects, prepare)
+        if not optimized:
+            report_batch(self, "Auto-optimize", 0, timings, failures)
+            return {'CANCELLED'}
         
-        # Step 3: UV unwrap if no UVs exist
-        if not optimized_obj.data.uv_layers:
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.uv.smart_project(angle_limit=66.0, island_margin=0.02)
-            bpy.ops.object.mode_set(mode='OBJECT')
+        # Step 3: UV unwrap the copies without UVs, all in one edit session
+        shared = 0.0
+        unmapped = [obj for obj in optimized if not obj.data.uv_layers]
+        if unmapped:
+            def smart_unwrap():
+                # Smart project only unwraps the selected faces
+                bpy.ops.mesh.select_all(action='SELECT')
+                bpy.ops.uv.smart_project(angle_limit=66.0, island_margin=0.02)
+            
+            shared = run_in_edit_mode(context, unmapped, smart_unwrap)
         
-        # Rename the optimized object
-        optimized_obj.name = original_obj.name + "_optimized"
+        stage_counts["unwrap"] = len(unmapped)
+        ran = [f"{stage} {count}" for stage, count in stage_counts.items() if count]
+        details = "stages run: " + ", ".join(ran) if ran else "already clean"
         
-        self.report({'INFO'}, f"Auto-optimization complete: {optimized_obj.name}")
+        select_only(context, optimized)
+        report_batch(self, "Auto-optimize", len(optimized), timings, failures, shared, details)
         return {'FINISHED'}
 
 class KDLZ_OT_ApplyCleanup(bpy.types.Operator):
@@ -271,47 +599,52 @@ class KDLZ_OT_ApplyCleanup(bpy.types.Operator):
     
     def execute(self, context):
         props = context.scene.kdlz_automesh_props
-        obj = context.active_object
+        objects = get_automesh_targets(context, props)
         
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "No mesh object selected")
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects to process")
             return {'CANCELLED'}
         
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all vertices
-        bpy.ops.mesh.select_all(action='SELECT')
-        
-        # Remove doubles if enabled
-        if props.remove_doubles:
-            bpy.ops.mesh.remove_doubles(threshold=props.merge_distance)
-        
-        # Fix non-manifold if enabled
-        if props.fix_non_manifold:
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.fill_holes()
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.delete_loose()
-        
-        # Recalculate normals if enabled
-        if props.recalculate_normals:
-            bpy.ops.mesh.normals_make_consistent(inside=False)
-        
-        # Remove loose geometry if enabled
-        if props.remove_loose:
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.delete_loose()
-        
-        # Triangulate if enabled
-        if props.triangulate:
-            bpy.ops.mesh.quads_convert_to_tris()
-        
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        self.report({'INFO'}, "Mesh cleanup completed")
-        return {'FINISHED'}
+        # bmesh works on object-mode data
+        ensure_object_mode(context)
+        
+        results, timings, failures = cleanup_objects(
+            objects,
+            merge_distance=props.merge_distance if props.remove_doubles else None,
+            # Fix non-manifold fills holes and drops loose parts
+            fill_holes=props.fix_non_manifold,
+            recalculate_normals=props.recalculate_normals,
+            delete_loose=props.fix_non_manifold or props.remove_loose,
+            triangulate=props.triangulate
+        )
+        
+        report_batch(self, "Cleanup", len(results), timings, failures)
+        return {'FINISHED'} if results else {'CANCELLED'}
+
+def unwrap_selected(props):
+    """Unwrap every mesh in edit mode with the chosen method"""
+    bpy.ops.mesh.select_all(action='SELECT')
+    
+    # Apply unwrap based on method
+    if props.unwrap_method == 'SMART':
+        bpy.ops.uv.smart_project(
+            angle_limit=props.angle_limit,
+            island_margin=props.island_margin
+        )
+    elif props.unwrap_method == 'LIGHTMAP':
+        bpy.ops.uv.lightmap_pack(
+            PREF_IMG_PX_SIZE=1024,
+            PREF_BOX_DIV=12,
+            PREF_MARGIN_DIV=0.1
+        )
+    elif props.unwrap_method == 'UNWRAP':
+        bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
+    elif props.unwrap_method == 'CUBE':
+        bpy.ops.uv.cube_project()
+    elif props.unwrap_method == 'CYLINDER':
+        bpy.ops.uv.cylinder_project()
+    elif props.unwrap_method == 'SPHERE':
+        bpy.ops.uv.sphere_project()
 
 class KDLZ_OT_ApplyUnwrap(bpy.types.Operator):
     bl_idname = "kdlz.apply_unwrap"
@@ -319,45 +652,26 @@ class KDLZ_OT_ApplyUnwrap(bpy.types.Operator):
     
     def execute(self, context):
         props = context.scene.kdlz_automesh_props
-        obj = context.active_object
+        objects = get_automesh_targets(context, props)
         
-        if not obj or obj.type != 'MESH':
-            self.report({'ERROR'}, "No mesh object selected")
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects to process")
             return {'CANCELLED'}
         
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all faces
-        bpy.ops.mesh.select_all(action='SELECT')
+        selected = context.selected_objects[:]
+        active = context.active_object
         
-        # Apply unwrap based on method
-        if props.unwrap_method == 'SMART':
-            bpy.ops.uv.smart_project(
-                angle_limit=props.angle_limit,
-                island_margin=props.island_margin
-            )
-        elif props.unwrap_method == 'LIGHTMAP':
-            bpy.ops.uv.lightmap_pack(
-                PREF_IMG_PX_SIZE=1024,
-                PREF_BOX_DIV=12,
-                PREF_MARGIN_DIV=0.1
-            )
-        elif props.unwrap_method == 'UNWRAP':
-            bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
-        elif props.unwrap_method == 'CUBE':
-            bpy.ops.uv.cube_project()
-        elif props.unwrap_method == 'CYLINDER':
-            bpy.ops.uv.cylinder_project()
-        elif props.unwrap_method == 'SPHERE':
-            bpy.ops.uv.sphere_project()
-        
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Every target is unwrapped in one edit session
+        try:
+            shared = run_in_edit_mode(context, objects, lambda: unwrap_selected(props))
+        except RuntimeError as e:
+            report_batch(self, f"UV unwrap ({props.unwrap_method})", 0, [], [(obj.name, str(e).strip()) for obj in objects])
+            return {'CANCELLED'}
+        finally:
+            select_only(context, selected, active)
         
-        self.report({'INFO'}, f"UV unwrap applied using {props.unwrap_method} method")
+        report_batch(self, f"UV unwrap ({props.unwrap_method})", len(objects), [], [], shared)
         return {'FINISHED'}
-
 class KDLZ_OT_Apply3DPrintPrep(bpy.types.Operator):
     bl_idname = "kdlz.apply_3d_print_prep"
     bl_label = "Apply 3D Print Prep"
@@ -370,6 +684,9 @@ class KDLZ_OT_Apply3DPrintPrep(bpy.types.Operator):
             self.report({'ERROR'}, "No mesh object selected")
             return {'CANCELLED'}
         
+        # The checks read object-mode mesh data
+        ensure_object_mode(context)
+        
         # Make solid if enabled
         if props.make_solid:
             # Add solidify modifier
@@ -396,26 +713,92 @@ class KDLZ_OT_Apply3DPrintPrep(bpy.types.Operator):
             # Return to object mode
             bpy.ops.object.mode_set(mode='OBJECT')
         
-        # Check watertight if enabled
+        # Check watertight if enabled, straight from the mesh buffers
+        report = None
         if props.check_watertight:
-            # Enter edit mode
-            bpy.ops.object.mode_set(mode='EDIT')
-            
-            # Select all
-            bpy.ops.mesh.select_all(action='SELECT')
-            
-            # Check for holes
-            bpy.ops.mesh.select_non_manifold()
-            
-            # Return to object mode
-            bpy.ops.object.mode_set(mode='OBJECT')
+            _mesh_reports.pop(obj.data.as_pointer(), None)
+            report = get_mesh_report(obj.data)
         
         # Apply 3D print toolbox checks
         if hasattr(bpy.ops, "mesh"):
             if hasattr(bpy.ops.mesh, "print3d_check_all"):
                 bpy.ops.mesh.print3d_check_all()
         
-        self.report({'INFO'}, "3D print preparation completed")
+        if report and not report["watertight"]:
+            self.report({'WARNING'}, f"3D print preparation completed, mesh is not watertight: "
+                                     f"{report['non_manifold_edges']} non-manifold edges, {report['boundary_loops']} holes")
+        else:
+            self.report({'INFO'}, "3D print preparation completed")
+        return {'FINISHED'}
+
+def export_objects(context, objects, filepath, props):
+    """Export `objects` to one file in the chosen format, leaving them selected"""
+    # Select only the target objects
+    select_only(context, objects)
+    
+    # Apply transforms if needed
+    if props.apply_transforms:
+        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+    
+    # Export based on format, newer Blenders replace the Python OBJ and STL exporters
+    if props.export_format == 'OBJ' and hasattr(bpy.types, "WM_OT_obj_export"):
+        bpy.ops.wm.obj_export(
+            filepath=filepath,
+            export_selected_objects=True,
+            export_materials=True,
+            export_triangulated_mesh=True
+        )
+    elif props.export_format == 'OBJ':
+        bpy.ops.export_scene.obj(
+            filepath=filepath,
+            use_selection=True,
+            use_materials=True,
+            use_triangles=True
+        )
+    elif props.export_format == 'FBX':
+        bpy.ops.export_scene.fbx(
+            filepath=filepath,
+            use_selection=True,
+            global_scale=props.export_scale,
+            apply_scale_options='FBX_SCALE_ALL',
+            mesh_smooth_type='FACE'
+        )
+    elif props.export_format == 'STL' and hasattr(bpy.types, "WM_OT_stl_export"):
+        bpy.ops.wm.stl_export(
+            filepath=filepath,
+            export_selected_objects=True,
+            global_scale=props.export_scale
+        )
+    elif props.export_format == 'STL':
+        bpy.ops.export_mesh.stl(
+            filepath=filepath,
+            use_selection=True,
+            global_scale=props.export_scale
+        )
+    elif props.export_format == 'GLTF':
+        bpy.ops.export_scene.gltf(
+            filepath=filepath,
+            use_selection=True,
+            export_format='GLTF_EMBEDDED'
+        )
+
+class KDLZ_OT_AnalyzeMesh(bpy.types.Operator):
+    bl_idname = "kdlz.analyze_mesh"
+    bl_label = "Analyze Mesh"
+    
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.mode != 'EDIT'
+    
+    def execute(self, context):
+        obj = context.active_object
+        report = get_mesh_report(obj.data)
+        
+        if report["watertight"]:
+            self.report({'INFO'}, f"{obj.name} is watertight")
+        else:
+            self.report({'WARNING'}, f"{obj.name} is not watertight: {report['non_manifold_edges']} non-manifold edges")
         return {'FINISHED'}
 
 class KDLZ_OT_ExportOptimizedMesh(bpy.types.Operator):
@@ -459,45 +842,7 @@ class KDLZ_OT_ExportOptimizedMesh(bpy.types.Operator):
         original_selection = context.selected_objects.copy()
         active_obj = context.active_object
         
-        # Deselect all
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        # Select only the target object
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        
-        # Apply transforms if needed
-        if props.apply_transforms:
-            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-        
-        # Export based on format
-        if props.export_format == 'OBJ':
-            bpy.ops.export_scene.obj(
-                filepath=self.filepath,
-                use_selection=True,
-                use_materials=True,
-                use_triangles=True
-            )
-        elif props.export_format == 'FBX':
-            bpy.ops.export_scene.fbx(
-                filepath=self.filepath,
-                use_selection=True,
-                global_scale=props.export_scale,
-                apply_scale_options='FBX_SCALE_ALL',
-                mesh_smooth_type='FACE'
-            )
-        elif props.export_format == 'STL':
-            bpy.ops.export_mesh.stl(
-                filepath=self.filepath,
-                use_selection=True,
-                global_scale=props.export_scale
-            )
-        elif props.export_format == 'GLTF':
-            bpy.ops.export_scene.gltf(
-                filepath=self.filepath,
-                use_selection=True,
-                export_format='GLTF_EMBEDDED'
-            )
+        export_objects(context, [obj], self.filepath, props)
         
         # Restore original selection
         bpy.ops.object.select_all(action='DESELECT')
@@ -509,6 +854,31 @@ class KDLZ_OT_ExportOptimizedMesh(bpy.types.Operator):
         return {'FINISHED'}
 
 class KDLZ_AutoMeshProps(bpy.types.PropertyGroup):
+    # Batch properties
+    batch_target: EnumProperty(
+        name="Process",
+        items=[
+            ('ACTIVE', "Active", "Process the active object"),
+            ('SELECTED', "Selected", "Process every selected mesh"),
+            ('COLLECTION', "Collection", "Process every mesh in a collection")
+        ],
+        default='ACTIVE'
+    )
+    
+    batch_collection: PointerProperty(
+        name="Collection",
+        type=bpy.types.Collection,
+        description="Collection whose meshes are processed"
+    )
+    
+    # Auto-Optimize properties
+    target_triangles: IntProperty(
+        name="Triangle Budget",
+        description="Auto-Optimize decimates meshes with more triangles than this, 0 never decimates",
+        default=200000,
+        min=0
+    )
+    
     # Remeshing properties
     remesh_method: EnumProperty(
         name="Method",
@@ -760,11 +1130,20 @@ def register():
     bpy.utils.register_class(KDLZ_OT_ApplyCleanup)
     bpy.utils.register_class(KDLZ_OT_ApplyUnwrap)
     bpy.utils.register_class(KDLZ_OT_Apply3DPrintPrep)
+    bpy.utils.register_class(KDLZ_OT_AnalyzeMesh)
     bpy.utils.register_class(KDLZ_OT_ExportOptimizedMesh)
     bpy.utils.register_class(KDLZ_AutoMeshProps)
     bpy.types.Scene.kdlz_automesh_props = bpy.props.PointerProperty(type=KDLZ_AutoMeshProps)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_mesh_reports)
+    bpy.app.handlers.load_post.append(clear_mesh_reports)
 
 def unregister():
+    if invalidate_mesh_reports in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_mesh_reports)
+    if clear_mesh_reports in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_mesh_reports)
+    clear_mesh_reports()
+    
     bpy.utils.unregister_class(KDLZ_PT_AutoMeshProPanel)
     bpy.utils.unregister_class(KDLZ_OT_AutoMeshPro)
     bpy.utils.unregister_class(KDLZ_OT_ApplyRetopology)
@@ -772,6 +1151,7 @@ def unregister():
     bpy.utils.unregister_class(KDLZ_OT_ApplyCleanup)
     bpy.utils.unregister_class(KDLZ_OT_ApplyUnwrap)
     bpy.utils.unregister_class(KDLZ_OT_Apply3DPrintPrep)
+    bpy.utils.unregister_class(KDLZ_OT_AnalyzeMesh)
     bpy.utils.unregister_class(KDLZ_OT_ExportOptimizedMesh)
     bpy.utils.unregister_class(KDLZ_AutoMeshProps)
     del bpy.types.Scene.kdlz_automesh_props
@@ -0,0 +1,206 @@
+"""NumPy mesh health analysis for AutoMesh Pro.
+
+Works on the flat index buffers a mesh hands out through foreach_get and
+never touches bpy, so one pass over plain arrays answers every check
+without entering edit mode.
+"""
+import numpy as np
+
+
+# Faces smaller than this many square units count as degenerate
+ZERO_AREA = 1e-12
+
+
+def connected_components(count, pairs):
+    """Component label per node for an undirected graph given as an (N, 2) array.
+
+    Hooks every pair onto the smaller label and then compresses the label
+    chains, repeating until nothing changes. Each node ends up labelled
+    with the smallest node index in its component.
+    """
+    labels = np.arange(count)
+    if len(pairs) == 0:
+        return labels
+
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[a], low)
+        np.minimum.at(hooked, labels[b], low)
+
+        # Point every node at its root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def loop_successors(loop_starts, loop_totals):
+    """Index of the next loop around each loop's polygon"""
+    loop_count = int(loop_totals.sum())
+    successors = np.arange(1, loop_count + 1)
+    successors[loop_starts + loop_totals - 1] = loop_starts
+    return successors
+
+
+# Cells per axis at most when hashing vertices, keeps cell ids within int64
+MAX_GRID_CELLS = 2 ** 20
+
+# Neighbouring cells with a higher id, each cell pair is visited once
+HALF_NEIGHBOURHOOD = [
+    (dx, dy, dz)
+    for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
+
+
+def close_pairs(verts, distance):
+    """(N, 2) index pairs of vertices at most `distance` apart.
+
+    Vertices are hashed into cells at least `distance` wide, so every
+    close pair sits in the same or in neighbouring cells. The cells are
+    sorted once, each neighbour cell's run is found with a binary search,
+    and the candidate pairs are kept by an exact distance test.
+    """
+    lo = verts.min(axis=0)
+    extent = float((verts.max(axis=0) - lo).max())
+    cell = max(distance, extent / MAX_GRID_CELLS, 1e-12)
+
+    # Cell coordinates padded by one, so neighbour offsets never wrap
+    keys = np.floor((verts - lo) / cell).astype(np.int64) + 1
+    dims = keys.max(axis=0) + 2
+    ids = (keys[:, 0] * dims[1] + keys[:, 1]) * dims[2] + keys[:, 2]
+
+    order = np.argsort(ids, kind="stable")
+    ids = ids[order]
+    points = verts[order]
+    slots = np.arange(len(ids))
+    run_ends = np.searchsorted(ids, ids, side="right")
+
+    # Later vertices of the own cell, then the runs of the neighbour cells
+    ranges = [(slots + 1, run_ends)]
+    for dx, dy, dz in HALF_NEIGHBOURHOOD:
+        neighbours = ids + (dx * dims[1] + dy) * dims[2] + dz
+        ranges.append((np.searchsorted(ids, neighbours, side="left"), np.searchsorted(ids, neighbours, side="right")))
+
+    pairs = []
+    for starts, stops in ranges:
+        counts = stops - starts
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        first = np.repeat(slots, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = np.repeat(starts, counts) + offsets
+        gaps = points[first] - points[second]
+        close = np.einsum("ij,ij->i", gaps, gaps) <= distance * distance
+        pairs.append(np.column_stack((order[first[close]], order[second[close]])))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(pairs)
+
+
+def coincident_vertex_count(verts, distance):
+    """Number of vertices a merge by `distance` would remove.
+
+    Exact duplicates are folded first so stacked vertices don't blow up
+    the pair search, then chains of close vertices are clustered and each
+    cluster keeps one vertex.
+    """
+    if len(verts) < 2:
+        return 0
+
+    ordered = verts[np.lexsort(verts.T)]
+    distinct = np.ones(len(ordered), dtype=bool)
+    distinct[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    unique = ordered[distinct]
+
+    labels = connected_components(len(unique), close_pairs(unique, distance))
+    clusters = int(np.count_nonzero(labels == np.arange(len(unique))))
+    return len(verts) - clusters
+
+
+def analyze_mesh(verts, edges, loop_starts, loop_totals, loop_verts, loop_edges):
+    """Health report for one mesh.
+
+    `verts` is (V, 3), `edges` (E, 2) vertex pairs, `loop_starts` and
+    `loop_totals` describe each polygon's run of loops, whose vertex and
+    edge indices are `loop_verts` and `loop_edges`. Returns a dict of
+    plain numbers.
+    """
+    vert_count = len(verts)
+    edge_count = len(edges)
+    face_count = len(loop_starts)
+
+    # Faces per edge: 0 is a wire edge, 1 a hole's rim, 3+ a fin
+    edge_faces = np.bincount(loop_edges, minlength=edge_count)
+    boundary = edge_faces == 1
+    wire = edge_faces == 0
+    multi = edge_faces > 2
+
+    # Components are counted by their roots, the nodes labelled with themselves
+    nodes = np.arange(vert_count)
+
+    # Every edge of a closed hole belongs to one boundary loop
+    boundary_edges = edges[boundary]
+    on_boundary = np.zeros(vert_count, dtype=bool)
+    on_boundary[boundary_edges.ravel()] = True
+    boundary_roots = connected_components(vert_count, boundary_edges) == nodes
+    boundary_loops = int(np.count_nonzero(boundary_roots & on_boundary))
+
+    # Parts are vertex islands, unused vertices count as parts of their own
+    loose_parts = int(np.count_nonzero(connected_components(vert_count, edges) == nodes))
+    used = np.zeros(vert_count, dtype=bool)
+    used[edges.ravel()] = True
+    loose_verts = vert_count - int(np.count_nonzero(used))
+
+    successors = loop_successors(loop_starts, loop_totals)
+    loop_faces = np.repeat(np.arange(face_count), loop_totals)
+    first = verts[loop_verts[loop_starts]][loop_faces]
+    current = verts[loop_verts]
+    following = verts[loop_verts[successors]]
+
+    # Newell's method: summed cross products give twice the area vector
+    crosses = np.cross(current, following)
+    if face_count:
+        area_vectors = np.add.reduceat(crosses, loop_starts, axis=0) / 2
+    else:
+        area_vectors = np.empty((0, 3))
+    areas = np.linalg.norm(area_vectors, axis=1)
+
+    # Two faces sharing an edge should walk it in opposite directions
+    manifold = edge_faces[loop_edges] == 2
+    forward = loop_verts == edges[loop_edges, 0]
+    forward_count = np.bincount(loop_edges[manifold], weights=forward[manifold], minlength=edge_count)
+    flipped_edges = int(np.count_nonzero((edge_faces == 2) & (forward_count != 1)))
+
+    # Signed volume from a fan of triangles per face, only closed meshes have one
+    volume = float(np.einsum("ij,ij->", first, crosses) / 6)
+    watertight = face_count > 0 and not (boundary.any() or wire.any() or multi.any())
+
+    return {
+        "vertices": vert_count,
+        "edges": edge_count,
+        "faces": face_count,
+        "triangles": int((loop_totals - 2).sum()),
+        "boundary_edges": int(np.count_nonzero(boundary)),
+        "wire_edges": int(np.count_nonzero(wire)),
+        "multi_face_edges": int(np.count_nonzero(multi)),
+        "non_manifold_edges": int(np.count_nonzero(boundary | wire | multi)),
+        "boundary_loops": boundary_loops,
+        "loose_parts": loose_parts,
+        "loose_vertices": loose_verts,
+        "zero_area_faces": int(np.count_nonzero(areas <= ZERO_AREA)),
+        "flipped_edges": flipped_edges,
+        "inside_out": watertight and flipped_edges == 0 and volume < 0.0,
+        "watertight": watertight,
+        "area": float(areas.sum()),
+        "volume": abs(volume) if watertight else None
+    }
@@ -1,9 +1,1098 @@
 import bpy
-import random
-import math
-import mathutils
+import gpu
+import hashlib
+import json
+import multiprocessing
+import os
+import uuid
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from bpy.app.handlers import persistent
+from gpu_extras.batch import batch_for_shader
 from bpy.props import FloatProperty, BoolProperty, EnumProperty, IntProperty, StringProperty, CollectionProperty, PointerProperty
 
+from .scatter_sampling import (
+    triangle_table, bezier_polyline, nurbs_polyline, arc_length_table, vertex_weights_to_triangles,
+    image_weights_to_triangles, occupancy_grid, global_overlap_steps, item_transform_steps,
+    generate_item_transforms, init_worker, merge_surface_targets, generate_worker_transforms, matrices_from_euler
+)
+
+def gather_mesh_triangles(mesh):
+    """Read vertex positions and loop triangle vertex and loop indices in bulk"""
+    mesh.calc_loop_triangles()
+    
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    
+    tri_loops = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    
+    return verts.reshape(-1, 3).astype(np.float64), tris.reshape(-1, 3), tri_loops.reshape(-1, 3)
+
+def gather_vertex_weights(obj, mesh, name):
+    """Per-vertex weights of `mesh` from one of obj's vertex groups or a float point attribute"""
+    weights = np.zeros(len(mesh.vertices), dtype=np.float32)
+    
+    # Float attributes can be read in one call
+    attribute = mesh.attributes.get(name)
+    if attribute and attribute.domain == 'POINT' and attribute.data_type == 'FLOAT':
+        attribute.data.foreach_get("value", weights)
+        return weights.astype(np.float64)
+    
+    # Targets without the group are masked out entirely
+    if name not in obj.vertex_groups:
+        return weights.astype(np.float64)
+    
+    # Deform weights have no bulk accessor, gather them in a single pass
+    group_index = obj.vertex_groups[name].index
+    for vertex in mesh.vertices:
+        for element in vertex.groups:
+            if element.group == group_index:
+                weights[vertex.index] = element.weight
+                break
+    return weights.astype(np.float64)
+
+def gather_image_pixels(image):
+    """Read an image's pixels once as an (H, W, C) array"""
+    width, height = image.size
+    pixels = np.empty(width * height * image.channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, image.channels)
+
+def gather_mask_weights(obj, mesh, item, table):
+    """Per-triangle density weights for an item's mask on one target mesh, or None without one"""
+    verts, tris, tri_loops = table[:3]
+    
+    if item.mask_type == 'VERTEX_GROUP':
+        weights = vertex_weights_to_triangles(tris, gather_vertex_weights(obj, mesh, item.mask_vertex_group))
+    elif item.mask_type == 'IMAGE' and not mesh.uv_layers.active:
+        weights = np.zeros(len(tris), dtype=np.float64)
+    elif item.mask_type == 'IMAGE':
+        loop_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", loop_uvs)
+        pixels = gather_image_pixels(item.mask_image)
+        weights = image_weights_to_triangles(tri_loops, loop_uvs.reshape(-1, 2), pixels)
+    else:
+        return None
+    
+    weights = np.clip(weights, 0.0, 1.0)
+    if item.mask_invert:
+        weights = 1.0 - weights
+    return weights
+
+def gather_spline_polyline(spline, resolution):
+    """Evaluate a curve spline into a dense local-space polyline.
+    
+    Control points are read in bulk; Bezier handles and NURBS weights,
+    order and endpoint settings are honoured.
+    """
+    cyclic = spline.use_cyclic_u
+    
+    if spline.type == 'BEZIER':
+        count = len(spline.bezier_points)
+        buffers = {}
+        for attr in ("co", "handle_left", "handle_right"):
+            values = np.empty(count * 3, dtype=np.float32)
+            spline.bezier_points.foreach_get(attr, values)
+            buffers[attr] = values.reshape(-1, 3).astype(np.float64)
+        return bezier_polyline(buffers["co"], buffers["handle_left"], buffers["handle_right"], cyclic, resolution)
+    
+    # Poly and NURBS points are 4D, w holds the NURBS weight
+    count = len(spline.points)
+    values = np.empty(count * 4, dtype=np.float32)
+    spline.points.foreach_get("co", values)
+    values = values.reshape(-1, 4).astype(np.float64)
+    
+    if spline.type == 'NURBS':
+        return nurbs_polyline(values[:, :3], values[:, 3], spline.order_u, cyclic, spline.use_endpoint_u, resolution)
+    
+    polyline = values[:, :3]
+    if cyclic and count > 2:
+        polyline = np.concatenate([polyline, polyline[:1]])
+    return polyline
+
+# Triangle sampling tables keyed on mesh pointer, reused while the fingerprint matches
+_surface_tables = {}
+
+# Mesh pointer -> (fingerprint, resolution, (grid, origin, cell_size)) for mesh volumes
+_volume_grids = {}
+
+# Timings of the most recent scatter run, read by benchmarks/scatter_benchmark.py
+last_scatter_stats = {}
+
+# Number of vertex positions folded into a mesh fingerprint
+FINGERPRINT_PROBES = 64
+
+def mesh_fingerprint(mesh):
+    """Cheap signature of a mesh: element counts plus a few sampled vertex positions"""
+    count = len(mesh.vertices)
+    step = max(count // FINGERPRINT_PROBES, 1)
+    vertices = mesh.vertices
+    probes = tuple(tuple(vertices[i].co) for i in range(0, count, step))
+    return (count, len(mesh.edges), len(mesh.polygons), len(mesh.loops), probes)
+
+def get_surface_table(mesh, key=None):
+    """Return (verts, tris, tri_loops, areas, normals, cdf), rebuilding only when the mesh changed.
+    
+    Evaluated meshes are temporary, so they are cached under their
+    original object's pointer passed as `key`.
+    """
+    key = key or mesh.as_pointer()
+    fingerprint = mesh_fingerprint(mesh)
+    
+    cached = _surface_tables.get(key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    
+    verts, tris, tri_loops = gather_mesh_triangles(mesh)
+    areas, normals, cdf = triangle_table(verts, tris)
+    table = (verts, tris, tri_loops, areas, normals, cdf)
+    _surface_tables[key] = (fingerprint, table)
+    return table
+
+def get_scatter_targets(props):
+    """Mesh objects to scatter on in SURFACE mode, without duplicates"""
+    if props.target_mode == 'COLLECTION':
+        objects = list(props.target_collection.all_objects) if props.target_collection else []
+    elif props.target_mode == 'LIST':
+        objects = [target.object for target in props.target_objects if target.object]
+    else:
+        target_obj = bpy.data.objects.get(props.target_object)
+        objects = [target_obj] if target_obj else []
+    
+    targets = []
+    for obj in objects:
+        if obj.type == 'MESH' and obj not in targets:
+            targets.append(obj)
+    return targets
+
+def gather_surface_target(obj, depsgraph, items):
+    """Sample the modifier-evaluated mesh of one target.
+    
+    Returns its fingerprint, cached triangle table and per-item mask
+    weights, all read while the temporary evaluated mesh exists.
+    """
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        fingerprint = mesh_fingerprint(mesh)
+        table = get_surface_table(mesh, key=obj.as_pointer())
+        
+        # Density masks, shared between items using the same source
+        weights = {}
+        sources = {}
+        for item in items:
+            if item.mask_type == 'NONE' or not item.object:
+                continue
+            image_name = item.mask_image.name if item.mask_image else ""
+            source = (item.mask_type, item.mask_vertex_group, image_name, item.mask_invert)
+            if source not in sources:
+                sources[source] = gather_mask_weights(obj, mesh, item, table)
+            weights[item.uid] = sources[source]
+    finally:
+        eval_obj.to_mesh_clear()
+    
+    return fingerprint, table, weights
+
+def get_volume_grid(mesh, resolution):
+    """Return the mesh's (grid, origin, cell_size) occupancy grid, voxelizing only when it changed"""
+    key = mesh.as_pointer()
+    fingerprint = mesh_fingerprint(mesh)
+    
+    cached = _volume_grids.get(key)
+    if cached and cached[0] == fingerprint and cached[1] == resolution:
+        return cached[2]
+    
+    verts, tris = get_surface_table(mesh)[:2]
+    grid = occupancy_grid(verts, tris, resolution)
+    _volume_grids[key] = (fingerprint, resolution, grid)
+    return grid
+
+@persistent
+def clear_scatter_caches(dummy=None):
+    """Drop cached sampling data, pointers are meaningless in a new file"""
+    _surface_tables.clear()
+    _volume_grids.clear()
+
+@persistent
+def reset_scatter_state(dummy=None):
+    """Clear job flags saved while a scatter was running"""
+    for scene in bpy.data.scenes:
+        scene.kdlz_scatter_props.is_scattering = False
+
+def _enabled_socket(sockets, name):
+    """Return the visible socket called `name` (typed nodes hide the others)"""
+    for socket in sockets:
+        if socket.name == name and socket.enabled:
+            return socket
+    return sockets[name]
+
+def build_instancer_node_group(items):
+    """Build a Geometry Nodes group that instances each item's object on its points"""
+    group = bpy.data.node_groups.new("KDLZ_Scatter_Instancer", 'GeometryNodeTree')
+    
+    # Blender 4.0 moved group sockets to the interface API
+    if hasattr(group, "interface"):
+        group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        group.inputs.new('NodeSocketGeometry', "Geometry")
+        group.outputs.new('NodeSocketGeometry', "Geometry")
+    
+    nodes = group.nodes
+    links = group.links
+    
+    group_input = nodes.new('NodeGroupInput')
+    group_input.location = (-800, 0)
+    group_output = nodes.new('NodeGroupOutput')
+    group_output.location = (600, 0)
+    
+    # Per-point attributes written by the scatter
+    attributes = {}
+    for offset, (attr_name, data_type) in enumerate((
+        ("kdlz_rotation", 'FLOAT_VECTOR'),
+        ("kdlz_scale", 'FLOAT_VECTOR'),
+        ("kdlz_item", 'INT'),
+        ("kdlz_lod", 'BOOLEAN')
+    )):
+        node = nodes.new('GeometryNodeInputNamedAttribute')
+        node.data_type = data_type
+        node.inputs["Name"].default_value = attr_name
+        node.location = (-800, -200 - offset * 150)
+        attributes[attr_name] = _enabled_socket(node.outputs, "Attribute")
+    
+    join = nodes.new('GeometryNodeJoinGeometry')
+    join.location = (400, 0)
+    
+    # One Instance on Points per item, selected by item index
+    for item_index, item in enumerate(items):
+        if not item.object:
+            continue
+        
+        y = -item_index * 600
+        
+        compare = nodes.new('FunctionNodeCompare')
+        compare.data_type = 'INT'
+        compare.operation = 'EQUAL'
+        _enabled_socket(compare.inputs, "B").default_value = item_index
+        compare.location = (-600, y - 150)
+        links.new(attributes["kdlz_item"], _enabled_socket(compare.inputs, "A"))
+        
+        # Items with a proxy split their points on the LOD flag
+        branches = [(item.object, compare.outputs["Result"])]
+        if item.proxy_object:
+            near = nodes.new('FunctionNodeBooleanMath')
+            near.operation = 'NIMPLY'
+            near.location = (-400, y - 100)
+            links.new(compare.outputs["Result"], near.inputs[0])
+            links.new(attributes["kdlz_lod"], near.inputs[1])
+            
+            far = nodes.new('FunctionNodeBooleanMath')
+            far.operation = 'AND'
+            far.location = (-400, y - 250)
+            links.new(compare.outputs["Result"], far.inputs[0])
+            links.new(attributes["kdlz_lod"], far.inputs[1])
+            
+            branches = [(item.object, near.outputs[0]), (item.proxy_object, far.outputs[0])]
+        
+        for branch, (source, selection) in enumerate(branches):
+            object_info = nodes.new('GeometryNodeObjectInfo')
+            object_info.transform_space = 'ORIGINAL'
+            object_info.inputs["Object"].default_value = source
+            if "As Instance" in object_info.inputs:
+                object_info.inputs["As Instance"].default_value = True
+            object_info.location = (-200, y - branch * 300)
+            
+            instance = nodes.new('GeometryNodeInstanceOnPoints')
+            instance.location = (100, y - branch * 300)
+            links.new(group_input.outputs[0], instance.inputs["Points"])
+            links.new(selection, instance.inputs["Selection"])
+            links.new(object_info.outputs["Geometry"], instance.inputs["Instance"])
+            links.new(attributes["kdlz_rotation"], instance.inputs["Rotation"])
+            links.new(attributes["kdlz_scale"], instance.inputs["Scale"])
+            links.new(instance.outputs["Instances"], join.inputs["Geometry"])
+    
+    links.new(join.outputs["Geometry"], group_output.inputs[0])
+    return group
+
+def find_point_instancer(collection):
+    """Return the point instancer object in the scatter collection, if any"""
+    for obj in collection.objects:
+        if "kdlz_item_uids" in obj:
+            return obj
+    return None
+
+def read_point_instancer(instancer):
+    """Read the instancer's attributes back as {item uid: (locations, rotations, scales, lods)}"""
+    mesh = instancer.data
+    count = len(mesh.vertices)
+    
+    locations = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", locations)
+    rotations = np.empty(count * 3, dtype=np.float32)
+    mesh.attributes["kdlz_rotation"].data.foreach_get("vector", rotations)
+    scales = np.empty(count * 3, dtype=np.float32)
+    mesh.attributes["kdlz_scale"].data.foreach_get("vector", scales)
+    item_indices = np.empty(count, dtype=np.int32)
+    mesh.attributes["kdlz_item"].data.foreach_get("value", item_indices)
+    lods = np.zeros(count, dtype=bool)
+    if "kdlz_lod" in mesh.attributes:
+        mesh.attributes["kdlz_lod"].data.foreach_get("value", lods)
+    
+    locations = locations.reshape(-1, 3)
+    rotations = rotations.reshape(-1, 3)
+    scales = scales.reshape(-1, 3)[:, 0]
+    
+    entries = {}
+    for item_index, uid in enumerate(instancer["kdlz_item_uids"]):
+        mask = item_indices == item_index
+        entries[uid] = (locations[mask], rotations[mask], scales[mask], lods[mask])
+    return entries
+
+def write_point_instancer(collection, items, entries):
+    """Write every scatter transform into one point cloud object.
+    
+    `entries` maps item uids to (locations, rotations, scales, lods) arrays.
+    Positions, rotations, scales, item indices and proxy flags are filled in bulk with
+    foreach_set and a generated Geometry Nodes modifier instances the
+    items. An existing instancer in the collection is reused.
+    """
+    locations = []
+    rotations = []
+    scales = []
+    item_indices = []
+    lods = []
+    for item_index, item in enumerate(items):
+        if item.uid not in entries:
+            continue
+        item_locations, item_rotations, item_scales, item_lods = entries[item.uid]
+        locations.append(item_locations)
+        rotations.append(item_rotations)
+        scales.append(item_scales)
+        item_indices.append(np.full(len(item_locations), item_index, dtype=np.int32))
+        lods.append(item_lods)
+    
+    locations = np.concatenate(locations or [np.empty((0, 3))]).astype(np.float32)
+    rotations = np.concatenate(rotations or [np.empty((0, 3))]).astype(np.float32)
+    scales = np.concatenate(scales or [np.empty(0)]).astype(np.float32)
+    scales = np.repeat(scales[:, None], 3, axis=1)
+    item_indices = np.concatenate(item_indices or [np.empty(0, dtype=np.int32)])
+    lods = np.concatenate(lods or [np.empty(0, dtype=bool)]).astype(bool)
+    count = len(locations)
+    
+    mesh = bpy.data.meshes.new("KDLZ_Scatter_Points")
+    mesh.vertices.add(count)
+    mesh.vertices.foreach_set("co", locations.ravel())
+    
+    mesh.attributes.new("kdlz_rotation", 'FLOAT_VECTOR', 'POINT').data.foreach_set("vector", rotations.ravel())
+    mesh.attributes.new("kdlz_scale", 'FLOAT_VECTOR', 'POINT').data.foreach_set("vector", scales.ravel())
+    mesh.attributes.new("kdlz_item", 'INT', 'POINT').data.foreach_set("value", item_indices)
+    mesh.attributes.new("kdlz_lod", 'BOOLEAN', 'POINT').data.foreach_set("value", lods)
+    mesh.update()
+    
+    instancer = find_point_instancer(collection)
+    if instancer:
+        # Swap in the new data and drop the old buffers
+        old_mesh = instancer.data
+        instancer.data = mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        modifier = instancer.modifiers.get("KDLZ_Scatter_Instancer")
+    else:
+        instancer = bpy.data.objects.new("KDLZ_Scatter_Points", mesh)
+        collection.objects.link(instancer)
+        modifier = None
+    
+    if modifier is None:
+        modifier = instancer.modifiers.new("KDLZ_Scatter_Instancer", 'NODES')
+    
+    old_group = modifier.node_group
+    modifier.node_group = build_instancer_node_group(items)
+    if old_group and old_group.users == 0:
+        bpy.data.node_groups.remove(old_group)
+    
+    instancer["kdlz_item_uids"] = [item.uid for item in items]
+    return instancer
+
+def get_item_collection(collection, uid, create=True):
+    """Return the child collection holding one scatter item's objects"""
+    for child in collection.children:
+        if child.get("kdlz_item_uid") == uid:
+            return child
+    if not create:
+        return None
+    
+    child = bpy.data.collections.new("KDLZ_Scatter_Item")
+    child["kdlz_item_uid"] = uid
+    collection.children.link(child)
+    return child
+
+def remove_ids(ids):
+    """Delete datablocks with one batch_remove call rather than one remove call each"""
+    ids = list(ids)
+    if ids:
+        bpy.data.batch_remove(ids)
+
+def purge_unused(ids):
+    """Delete the datablocks in `ids` that nothing uses any more"""
+    remove_ids({id_data for id_data in ids if id_data.users == 0})
+
+def remove_objects(objects):
+    """Delete objects in one batch, with the scatter-owned data they leave unused"""
+    objects = list(objects)
+    
+    # Instancer meshes and node groups belong to ScatterCraft, copies share
+    # the user's item data which must stay
+    owned = []
+    for obj in objects:
+        if "kdlz_item_uids" in obj:
+            owned.append(obj.data)
+            owned.extend(mod.node_group for mod in obj.modifiers if mod.type == 'NODES' and mod.node_group)
+    
+    remove_ids(objects)
+    purge_unused(owned)
+
+def remove_collections(collections):
+    """Delete collections along with every object and child collection inside them"""
+    collections = list(collections)
+    objects = set()
+    children = set()
+    
+    # Walk nested collections by hand, children_recursive needs Blender 3.1
+    pending = collections
+    while pending:
+        collection = pending.pop()
+        if collection in children:
+            continue
+        children.add(collection)
+        objects.update(collection.all_objects)
+        pending.extend(collection.children)
+    
+    remove_objects(objects)
+    remove_ids(children)
+
+def get_scatter_collection(context):
+    """Return the collection holding all scatter results, creating it if needed"""
+    collection_name = "KDLZ_Scattered_Objects"
+    if collection_name in bpy.data.collections:
+        return bpy.data.collections[collection_name]
+    
+    collection = bpy.data.collections.new(collection_name)
+    context.scene.collection.children.link(collection)
+    return collection
+
+def link_instance_chunks(staged, item, entry):
+    """Link one object copy per instance into the empty `staged`, yielding the count after each chunk.
+    
+    Copies keep their source's transform until every one is linked, then
+    each transform channel is written for all of them in one foreach_set.
+    Copies are switched to XYZ Euler rotation so the written angles apply.
+    """
+    locations, rotations, scales, lods = entry
+    
+    # Far instances use the proxy when the item has one
+    sources = (item.object, item.proxy_object or item.object)
+    for start in range(0, len(locations), SCATTER_CHUNK_SIZE):
+        chunk_lods = lods[start:start + SCATTER_CHUNK_SIZE].tolist()
+        for lod in chunk_lods:
+            # Object copies share their source's data
+            copy = sources[lod].copy()
+            if copy.rotation_mode != 'XYZ':
+                # Rotations are written as XYZ Euler angles, other modes would ignore or reorder them
+                copy.rotation_mode = 'XYZ'
+            staged.objects.link(copy)
+        
+        yield len(chunk_lods)
+    
+    objects = staged.objects
+    objects.foreach_set("location", np.ascontiguousarray(locations, dtype=np.float32).ravel())
+    objects.foreach_set("rotation_euler", np.ascontiguousarray(rotations, dtype=np.float32).ravel())
+    objects.foreach_set("scale", np.repeat(np.asarray(scales, dtype=np.float32), 3))
+
+def read_item_collection(child, item):
+    """Read an item collection's instances back as (locations, rotations, scales, lods)"""
+    objects = child.objects
+    count = len(objects)
+    
+    locations = np.empty(count * 3, dtype=np.float32)
+    objects.foreach_get("location", locations)
+    rotations = np.empty(count * 3, dtype=np.float32)
+    objects.foreach_get("rotation_euler", rotations)
+    scales = np.empty(count * 3, dtype=np.float32)
+    objects.foreach_get("scale", scales)
+    
+    lods = np.zeros(count, dtype=bool)
+    if item.proxy_object:
+        proxy_data = item.proxy_object.data
+        lods = np.array([obj.data == proxy_data for obj in objects], dtype=bool)
+    
+    return locations.reshape(-1, 3), rotations.reshape(-1, 3), scales.reshape(-1, 3)[:, 0], lods
+
+def property_values(struct, skip=()):
+    """Plain, JSON-ready copy of a property group's values"""
+    values = {}
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+        if name == "rna_type" or name in skip:
+            continue
+        
+        value = getattr(struct, name)
+        if prop.type == 'POINTER':
+            value = value.name if value else ""
+        elif prop.type == 'COLLECTION':
+            value = [property_values(element) for element in value]
+        elif getattr(prop, "is_array", False):
+            value = list(value)
+        values[name] = value
+    return values
+
+def cache_path_error(path):
+    """Return why a scatter cache path can't be used, or None"""
+    if not path:
+        return "No scatter cache path set"
+    if path.startswith("//") and not bpy.data.filepath:
+        return "Save the .blend file first or use an absolute scatter cache path"
+    return None
+
+# Bumped whenever the layout of scatter cache files changes
+SCATTER_CACHE_VERSION = 1
+
+def save_scatter_cache(path, items, entries, parameters):
+    """Write every item's transforms and the settings behind them to one .npz file"""
+    cached = [item for item in items if item.uid in entries]
+    
+    columns = [[], [], [], []]
+    item_indices = []
+    for cache_index, item in enumerate(cached):
+        for column, values in zip(columns, entries[item.uid]):
+            column.append(values)
+        item_indices.append(np.full(len(entries[item.uid][0]), cache_index, dtype=np.int32))
+    
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez_compressed(
+        path,
+        version=np.array(SCATTER_CACHE_VERSION),
+        locations=np.concatenate(columns[0] or [np.empty((0, 3))]).astype(np.float32),
+        rotations=np.concatenate(columns[1] or [np.empty((0, 3))]).astype(np.float32),
+        scales=np.concatenate(columns[2] or [np.empty(0)]).astype(np.float32),
+        lods=np.concatenate(columns[3] or [np.empty(0, dtype=bool)]).astype(bool),
+        item_indices=np.concatenate(item_indices or [np.empty(0, dtype=np.int32)]),
+        item_uids=np.array([item.uid for item in cached], dtype=str),
+        item_objects=np.array([item.object.name if item.object else "" for item in cached], dtype=str),
+        result_keys=np.array([item.result_key for item in cached], dtype=str),
+        parameters=np.array(json.dumps(parameters))
+    )
+
+def load_scatter_cache(path):
+    """Read a scatter cache file into a list of (uid, object name, result key, entry)"""
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["version"]) != SCATTER_CACHE_VERSION:
+            raise ValueError(f"Unsupported scatter cache version {int(data['version'])}")
+        
+        item_indices = data["item_indices"]
+        columns = [data["locations"], data["rotations"], data["scales"], data["lods"]]
+        
+        cached = []
+        for cache_index, uid in enumerate(data["item_uids"]):
+            mask = item_indices == cache_index
+            entry = tuple(column[mask] for column in columns)
+            cached.append((str(uid), str(data["item_objects"][cache_index]), str(data["result_keys"][cache_index]), entry))
+    return cached
+
+def clear_item_results(collection, items, uid):
+    """Remove one item's results, leaving every other item's output alone"""
+    child = get_item_collection(collection, uid, create=False)
+    if child:
+        remove_collections([child])
+    
+    instancer = find_point_instancer(collection)
+    if instancer and uid in instancer["kdlz_item_uids"]:
+        entries = read_point_instancer(instancer)
+        del entries[uid]
+        if any(len(entry[0]) for entry in entries.values()):
+            write_point_instancer(collection, items, entries)
+        else:
+            remove_objects([instancer])
+
+def get_scatter_camera(scene, props):
+    """The camera used for culling and LOD, falling back to the scene camera"""
+    camera = bpy.data.objects.get(props.camera_object) if props.camera_object else scene.camera
+    if camera and camera.type == 'CAMERA':
+        return camera
+    return None
+
+def camera_setup(context, props):
+    """Plain camera data for the item jobs, or None when culling and LOD are off"""
+    if not (props.use_frustum_culling or props.use_distance_lod):
+        return None
+    
+    scene = context.scene
+    render = scene.render
+    camera = get_scatter_camera(scene, props)
+    
+    # Same framing as the final render, including the aspect ratio
+    projection = camera.calc_matrix_camera(
+        context.evaluated_depsgraph_get(),
+        x=render.resolution_x,
+        y=render.resolution_y,
+        scale_x=render.pixel_aspect_x,
+        scale_y=render.pixel_aspect_y
+    )
+    
+    return dict(
+        cull=props.use_frustum_culling,
+        margin=props.cull_margin,
+        view_projection=np.array(projection) @ np.array(camera.matrix_world.inverted()),
+        location=tuple(camera.matrix_world.translation),
+        lod_distance=props.lod_distance if props.use_distance_lod else None
+    )
+
+def camera_signature(camera):
+    """Hashable form of camera_setup's result"""
+    if camera is None:
+        return None
+    return tuple(
+        (key, np.round(value, 6).tolist() if isinstance(value, np.ndarray) else value)
+        for key, value in sorted(camera.items())
+    )
+
+def collision_radius(obj, include_height):
+    """Half the largest local bounding box side, only the XY footprint unless include_height"""
+    corners = np.array([tuple(corner) for corner in obj.bound_box])
+    extent = corners.max(axis=0) - corners.min(axis=0)
+    if not include_height:
+        extent = extent[:2]
+    return float(extent.max()) / 2
+
+def scatter_method_signature(props, surface_signature=()):
+    """Describe the scatter source so item keys change when it does.
+    
+    SURFACE targets are described by `surface_signature`, built from the
+    evaluated meshes the job already gathered.
+    """
+    if props.scatter_method == 'SURFACE':
+        return (props.target_mode, surface_signature)
+    
+    if props.scatter_method == 'VOLUME':
+        volume_obj = bpy.data.objects.get(props.volume_object)
+        if props.volume_shape == 'MESH' and volume_obj and volume_obj.type == 'MESH':
+            return (
+                props.volume_object,
+                props.volume_resolution,
+                tuple(tuple(row) for row in volume_obj.matrix_world),
+                mesh_fingerprint(volume_obj.data)
+            )
+        return (props.volume_shape, props.volume_object, tuple(props.volume_size), tuple(props.volume_center))
+    
+    path_obj = bpy.data.objects.get(props.path_object)
+    if path_obj and path_obj.type == 'CURVE':
+        points = []
+        for spline in path_obj.data.splines:
+            if spline.type == 'BEZIER':
+                points.extend((tuple(p.co), tuple(p.handle_left), tuple(p.handle_right)) for p in spline.bezier_points)
+            else:
+                points.extend(tuple(p.co) for p in spline.points)
+            points.append((spline.type, spline.use_cyclic_u, spline.order_u, spline.use_endpoint_u))
+        return (
+            props.path_object,
+            props.path_offset,
+            props.path_resolution,
+            tuple(tuple(row) for row in path_obj.matrix_world),
+            tuple(points)
+        )
+    return (props.path_object, props.path_offset)
+
+def scatter_item_key(props, item, method_signature, mask_signature=""):
+    """Hash everything that affects one item's generated instances"""
+    values = (
+        item.object.name if item.object else "",
+        item.proxy_object.name if item.proxy_object else "",
+        item.random_seed,
+        item.density,
+        item.scale_min,
+        item.scale_max,
+        item.rotation_min,
+        item.rotation_max,
+        item.align_to_normal,
+        props.scatter_method,
+        props.distribution,
+        props.avoid_overlap,
+        props.overlap_mode,
+        props.min_distance,
+        props.output_mode,
+        method_signature,
+        mask_signature
+    )
+    return hashlib.sha1(repr(values).encode("utf-8")).hexdigest()
+
+def scatter_setup_error(context):
+    """Return why the scatter settings can't be sampled, or None"""
+    props = context.scene.kdlz_scatter_props
+    
+    # Check if we have scatter items
+    if len(props.scatter_items) == 0:
+        return "No scatter items defined"
+    
+    if props.scatter_method == 'SURFACE':
+        if props.target_mode == 'OBJECT':
+            target_obj = bpy.data.objects.get(props.target_object)
+            if not target_obj:
+                return "No target object selected"
+            if target_obj.type != 'MESH':
+                return "Target must be a mesh object"
+        
+        targets = get_scatter_targets(props)
+        if not targets:
+            return "No mesh target objects to scatter on"
+        
+        # Density mask sources must exist on at least one target
+        for item in props.scatter_items:
+            if not item.object:
+                continue
+            if item.mask_type == 'VERTEX_GROUP':
+                name = item.mask_vertex_group
+                if not any(name in obj.vertex_groups or name in obj.data.attributes for obj in targets):
+                    return f"Vertex group '{name}' not found on any target"
+            elif item.mask_type == 'IMAGE':
+                if not item.mask_image or item.mask_image.size[0] == 0:
+                    return "Mask image is missing or has no pixels"
+                if not any(obj.data.uv_layers.active for obj in targets):
+                    return "Targets need a UV map for image masks"
+    
+    elif props.scatter_method == 'VOLUME' and props.volume_shape == 'MESH':
+        volume_obj = bpy.data.objects.get(props.volume_object)
+        if not volume_obj:
+            return "No volume object selected"
+        if volume_obj.type != 'MESH':
+            return "Volume object must be a mesh"
+        if len(volume_obj.data.polygons) == 0:
+            return "Volume mesh has no faces"
+    
+    elif props.scatter_method == 'PATH':
+        path_obj = bpy.data.objects.get(props.path_object)
+        if not path_obj:
+            return "No path object selected"
+        if path_obj.type != 'CURVE':
+            return "Path object must be a curve"
+    
+    # Culling and LOD are measured from a camera
+    if props.use_frustum_culling or props.use_distance_lod:
+        if not get_scatter_camera(context.scene, props):
+            return "No camera for culling or LOD, set one or give the scene a camera"
+    
+    return None
+
+def ensure_item_uids(items):
+    """Give items saved without a uid one, masks and results are keyed by it"""
+    for item in items:
+        if not item.uid:
+            item.uid = uuid.uuid4().hex
+
+def build_item_job(props, item, weights):
+    """Pack one item's settings and density mask into a plain dict.
+    
+    Jobs hold nothing but numbers, strings and NumPy arrays, so they can
+    be pickled to worker processes. The method's source buffers are the
+    same for every item and are merged in by the caller, or handed to
+    each pool worker once.
+    """
+    return dict(
+        method=props.scatter_method,
+        distribution=props.distribution,
+        avoid_overlap=props.avoid_overlap and props.overlap_mode == 'ITEM',
+        min_distance=props.min_distance,
+        seed=item.random_seed,
+        density=item.density,
+        scale_min=item.scale_min,
+        scale_max=item.scale_max,
+        rotation_min=item.rotation_min,
+        rotation_max=item.rotation_max,
+        align_to_normal=item.align_to_normal,
+        use_proxy=item.proxy_object is not None,
+        weights=weights
+    )
+
+def gather_scatter_sources(context, props):
+    """Gather everything the item jobs sample from.
+    
+    Returns the source buffers shared by every item's job, the density
+    mask weights per item uid and the SURFACE targets' signature.
+    """
+    masks = {}
+    surface_signature = ()
+    if props.scatter_method == 'SURFACE':
+        depsgraph = context.evaluated_depsgraph_get()
+        
+        # Triangulated area tables of the evaluated meshes, cached across runs
+        parts = []
+        part_masks = []
+        for target_obj in get_scatter_targets(props):
+            fingerprint, table, weights = gather_surface_target(target_obj, depsgraph, props.scatter_items)
+            matrix_world = np.array(target_obj.matrix_world)
+            parts.append((table, matrix_world))
+            part_masks.append(weights)
+            surface_signature += ((target_obj.name, tuple(map(tuple, matrix_world.tolist())), fingerprint),)
+        
+        if not any(len(table[1]) for table, matrix_world in parts):
+            raise RuntimeError("Target meshes have no faces after modifiers")
+        
+        # World-space areas even for one target, so its instance count and
+        # spread don't depend on whether it's alone or in a list
+        verts, tris, areas, normals, cdf = merge_surface_targets(parts)
+        surface = dict(verts=verts, tris=tris, areas=areas, normals=normals, cdf=cdf, matrix_world=np.identity(4))
+        
+        # Items without a mask on one target get nothing there
+        for uid in set().union(*part_masks):
+            masks[uid] = np.concatenate([
+                weights[uid] if uid in weights else np.zeros(len(table[1]))
+                for (table, _), weights in zip(parts, part_masks)
+            ])
+    
+    # Source buffers shared by every item's job
+    if props.scatter_method == 'SURFACE':
+        shared = dict(surface)
+    elif props.scatter_method == 'VOLUME' and props.volume_shape == 'MESH':
+        volume_obj = bpy.data.objects.get(props.volume_object)
+        
+        # Inside/outside grid, cached across runs and items
+        grid, origin, cell_size = get_volume_grid(volume_obj.data, props.volume_resolution)
+        shared = dict(volume_grid=grid, volume_origin=origin, volume_cell_size=cell_size,
+                      matrix_world=np.array(volume_obj.matrix_world))
+    elif props.scatter_method == 'VOLUME':
+        shared = dict(volume_size=tuple(props.volume_size), volume_center=tuple(props.volume_center))
+    else:
+        path_obj = bpy.data.objects.get(props.path_object)
+        
+        # Evaluate every spline into an arc-length table once for all items
+        splines = []
+        for spline in path_obj.data.splines:
+            polyline = gather_spline_polyline(spline, props.path_resolution)
+            if len(polyline) > 1:
+                splines.append((polyline,) + arc_length_table(polyline))
+        shared = dict(splines=splines, matrix_world=np.array(path_obj.matrix_world), path_offset=props.path_offset)
+    
+    shared["camera"] = camera_setup(context, props)
+    return shared, masks, surface_signature
+
+def overlap_batches(props, items, transforms):
+    """(locations, radii) per item for the shared overlap pass"""
+    include_height = props.scatter_method == 'VOLUME'
+    batches = []
+    for item, (locations, rotations, scales, lods) in zip(items, transforms):
+        radius = collision_radius(item.object, include_height)
+        batches.append((locations, radius * np.abs(scales)))
+    return batches
+
+# Live preview state: sampled points and their GPU batches, never bpy.data
+_preview = {"handler": None, "results": [], "batches": None, "error": "", "settings": None}
+
+# Seconds without further edits before the preview resamples
+PREVIEW_DELAY = 0.25
+
+# Point colours, cycled through the scatter items
+PREVIEW_COLORS = (
+    (0.95, 0.55, 0.15, 1.0),
+    (0.25, 0.7, 0.95, 1.0),
+    (0.5, 0.9, 0.3, 1.0),
+    (0.9, 0.3, 0.6, 1.0),
+    (0.95, 0.9, 0.3, 1.0),
+    (0.6, 0.45, 0.95, 1.0),
+)
+
+# Settings that only change how the preview is drawn, or report progress
+PREVIEW_DISPLAY_PROPS = {
+    "is_scattering", "progress", "progress_message",
+    "show_preview", "preview_markers", "preview_point_size", "preview_max_points"
+}
+
+def preview_settings(scene, props):
+    """Every setting the preview's points depend on, to tell real edits from other scene updates"""
+    camera = get_scatter_camera(scene, props)
+    return property_values(props, skip=PREVIEW_DISPLAY_PROPS), camera.name if camera else ""
+
+def preview_sources(scene, props):
+    """Data-blocks whose edits move the preview's points"""
+    sources = set(get_scatter_targets(props))
+    for data in (props.target_collection, bpy.data.objects.get(props.volume_object),
+                 bpy.data.objects.get(props.path_object), get_scatter_camera(scene, props)):
+        if data:
+            sources.add(data)
+    for item in props.scatter_items:
+        for data in (item.object, item.proxy_object, item.mask_image):
+            if data:
+                sources.add(data)
+    return sources
+
+def compute_scatter_preview(context):
+    """Sample every item without creating anything.
+    
+    Returns (item uid, locations, rotations, scales) per item, after
+    the shared overlap pass when that's enabled.
+    """
+    props = context.scene.kdlz_scatter_props
+    ensure_item_uids(props.scatter_items)
+    shared, masks, surface_signature = gather_scatter_sources(context, props)
+    
+    items = [item for item in props.scatter_items if item.object]
+    transforms = [generate_item_transforms(dict(shared, **build_item_job(props, item, masks.get(item.uid)))) for item in items]
+    
+    if props.avoid_overlap and props.overlap_mode == 'GLOBAL':
+        steps = global_overlap_steps(overlap_batches(props, items, transforms))
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                keep_masks = done.value
+                break
+        transforms = [tuple(values[keep] for values in item_transforms)
+                      for item_transforms, keep in zip(transforms, keep_masks)]
+    
+    return [(item.uid, locations, rotations, scales)
+            for item, (locations, rotations, scales, lods) in zip(items, transforms)]
+
+def preview_shader():
+    """Builtin flat colour shader, renamed in Blender 3.4"""
+    return gpu.shader.from_builtin('UNIFORM_COLOR' if bpy.app.version >= (3, 4, 0) else '3D_UNIFORM_COLOR')
+
+def build_preview_batches(props):
+    """GPU batches for the sampled points, thinned to the preview point budget"""
+    shader = preview_shader()
+    total = sum(len(result[1]) for result in _preview["results"])
+    stride = max(-(-total // props.preview_max_points), 1)
+    
+    # Results are keyed by uid, items may have been removed or moved since sampling
+    items = {item.uid: (item_index, item) for item_index, item in enumerate(props.scatter_items) if item.object}
+    
+    batches = []
+    for uid, locations, rotations, scales in _preview["results"]:
+        locations = locations[::stride]
+        if len(locations) == 0 or uid not in items:
+            continue
+        item_index, item = items[uid]
+        color = PREVIEW_COLORS[item_index % len(PREVIEW_COLORS)]
+        batches.append((batch_for_shader(shader, 'POINTS', {"pos": locations.astype(np.float32)}), color))
+        
+        if props.preview_markers:
+            # A line along each instance's local Z, as tall as the item
+            height = collision_radius(item.object, True) * 2 * scales[::stride]
+            up = matrices_from_euler(rotations[::stride])[:, :, 2] * height[:, None]
+            lines = np.empty((2 * len(locations), 3), dtype=np.float32)
+            lines[0::2] = locations
+            lines[1::2] = locations + up
+            batches.append((batch_for_shader(shader, 'LINES', {"pos": lines}), color))
+    
+    return batches
+
+def draw_scatter_preview():
+    """Viewport draw callback for the scatter point preview"""
+    props = bpy.context.scene.kdlz_scatter_props
+    if not props.show_preview or props.is_scattering or not _preview["results"]:
+        return
+    
+    # Batches need a GPU context, build them on the first draw after sampling
+    if _preview["batches"] is None:
+        _preview["batches"] = build_preview_batches(props)
+    
+    shader = preview_shader()
+    gpu.state.point_size_set(props.preview_point_size)
+    gpu.state.depth_test_set('LESS_EQUAL')
+    shader.bind()
+    for batch, color in _preview["batches"]:
+        shader.uniform_float("color", color)
+        batch.draw(shader)
+    gpu.state.depth_test_set('NONE')
+    gpu.state.point_size_set(1.0)
+
+def tag_view3d_redraw():
+    """Redraw every 3D viewport"""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def refresh_scatter_preview():
+    """Timer callback, resamples the preview from the current settings"""
+    context = bpy.context
+    props = context.scene.kdlz_scatter_props
+    if not props.show_preview or props.is_scattering:
+        return None
+    
+    error = scatter_setup_error(context)
+    settings = preview_settings(context.scene, props)
+    results = []
+    if not error:
+        try:
+            results = compute_scatter_preview(context)
+        except RuntimeError as e:
+            error = str(e)
+    
+    _preview.update(results=results, batches=None, error=error or "", settings=settings)
+    tag_view3d_redraw()
+    return None
+
+def schedule_preview_refresh():
+    """Resample the preview once edits pause for PREVIEW_DELAY"""
+    if bpy.app.timers.is_registered(refresh_scatter_preview):
+        bpy.app.timers.unregister(refresh_scatter_preview)
+    bpy.app.timers.register(refresh_scatter_preview, first_interval=PREVIEW_DELAY)
+
+def sync_scatter_preview(scene):
+    """Add or remove the draw handler to match the scene's Show Preview setting"""
+    _preview.update(results=[], batches=None, error="", settings=None)
+    
+    # Nothing to draw into without a window
+    show = scene.kdlz_scatter_props.show_preview and not bpy.app.background
+    if show and _preview["handler"] is None:
+        _preview["handler"] = bpy.types.SpaceView3D.draw_handler_add(draw_scatter_preview, (), 'WINDOW', 'POST_VIEW')
+    elif not show and _preview["handler"] is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_preview["handler"], 'WINDOW')
+        _preview["handler"] = None
+    
+    if show:
+        schedule_preview_refresh()
+    elif bpy.app.timers.is_registered(refresh_scatter_preview):
+        bpy.app.timers.unregister(refresh_scatter_preview)
+
+def update_show_preview(self, context):
+    """Start or stop the preview when Show Preview is toggled"""
+    sync_scatter_preview(context.scene)
+    if not bpy.app.background:
+        tag_view3d_redraw()
+
+def update_preview_drawing(self, context):
+    """Rebuild the preview's batches from the points already sampled"""
+    _preview["batches"] = None
+    if not bpy.app.background:
+        tag_view3d_redraw()
+
+@persistent
+def scatter_preview_depsgraph(scene, depsgraph=None):
+    """Resample the preview after settings or source geometry change"""
+    props = scene.kdlz_scatter_props
+    if _preview["handler"] is None or not props.show_preview or props.is_scattering or depsgraph is None:
+        return
+    
+    # Selection, frame and unrelated object edits update the depsgraph too
+    sources = preview_sources(scene, props)
+    for update in depsgraph.updates:
+        data = update.id.original
+        if isinstance(data, bpy.types.Scene):
+            changed = data == scene and preview_settings(scene, props) != _preview["settings"]
+        else:
+            changed = data in sources
+        if changed:
+            schedule_preview_refresh()
+            return
+
+@persistent
+def scatter_preview_load(dummy=None):
+    """Restore the preview of a newly loaded file"""
+    sync_scatter_preview(bpy.context.scene)
+
 class KDLZ_ScatterItem(bpy.types.PropertyGroup):
     """Group of properties for a scatter item"""
     object: PointerProperty(
@@ -66,6 +1155,65 @@ class KDLZ_ScatterItem(bpy.types.PropertyGroup):
         default=1,
         min=1
     )
+    
+    mask_type: EnumProperty(
+        name="Density Mask",
+        items=[
+            ('NONE', "None", "Scatter over the whole surface"),
+            ('VERTEX_GROUP', "Vertex Group", "Weight density by a vertex group on the target"),
+            ('IMAGE', "Image", "Weight density by an image sampled through the target's active UV map")
+        ],
+        default='NONE'
+    )
+    
+    mask_vertex_group: StringProperty(
+        name="Vertex Group",
+        description="Vertex group on the target whose weights scale the density"
+    )
+    
+    mask_image: PointerProperty(
+        name="Mask Image",
+        type=bpy.types.Image,
+        description="Image whose brightness scales the density"
+    )
+    
+    mask_invert: BoolProperty(
+        name="Invert Mask",
+        description="Scatter where the mask is dark instead of bright",
+        default=False
+    )
+    
+    proxy_object: PointerProperty(
+        name="Proxy Object",
+        type=bpy.types.Object,
+        description="Low-detail stand-in placed beyond the LOD distance"
+    )
+    
+    uid: StringProperty(
+        name="UID",
+        description="Stable identifier linking the item to its scatter results",
+        default="",
+        options={'HIDDEN'}
+    )
+    
+    result_key: StringProperty(
+        name="Result Key",
+        description="Hash of the settings the current scatter results were generated with",
+        default="",
+        options={'HIDDEN'}
+    )
+
+def _poll_mesh_object(self, obj):
+    return obj.type == 'MESH'
+
+class KDLZ_ScatterTarget(bpy.types.PropertyGroup):
+    """One entry of the surface target list"""
+    object: PointerProperty(
+        name="Target",
+        type=bpy.types.Object,
+        description="Mesh to scatter on",
+        poll=_poll_mesh_object
+    )
 
 class KDLZ_PT_ScatterCraftPanel(bpy.types.Panel):
     bl_label = "ScatterCraft"
@@ -79,44 +1227,92 @@ class KDLZ_PT_ScatterCraftPanel(bpy.types.Panel):
         layout = self.layout
         props = context.scene.kdlz_scatter_props
         
+        # Settings can't change while a scatter job is reading them
+        editable = not props.is_scattering
+        
         # Distribution Settings
         box = layout.box()
+        box.enabled = editable
         box.label(text="Distribution Settings", icon="PARTICLES")
         
         col = box.column(align=True)
         col.prop(props, "scatter_method")
         
+        if props.scatter_method in {'SURFACE', 'VOLUME'}:
+            col.prop(props, "distribution")
+        
         if props.scatter_method == 'SURFACE':
-            col.prop_search(props, "target_object", context.scene, "objects")
+            col.prop(props, "target_mode")
+            if props.target_mode == 'COLLECTION':
+                col.prop(props, "target_collection")
+            elif props.target_mode == 'LIST':
+                for index, target in enumerate(props.target_objects):
+                    row = col.row(align=True)
+                    row.prop(target, "object", text="")
+                    op = row.operator("kdlz.remove_scatter_target", text="", icon="X")
+                    op.index = index
+                col.operator("kdlz.add_scatter_target", icon="ADD")
+            else:
+                col.prop_search(props, "target_object", context.scene, "objects")
         elif props.scatter_method == 'VOLUME':
-            col.prop(props, "volume_size")
-            col.prop(props, "volume_center")
+            col.prop(props, "volume_shape")
+            if props.volume_shape == 'MESH':
+                col.prop_search(props, "volume_object", context.scene, "objects")
+                col.prop(props, "volume_resolution")
+            else:
+                col.prop(props, "volume_size")
+                col.prop(props, "volume_center")
         elif props.scatter_method == 'PATH':
             col.prop_search(props, "path_object", context.scene, "objects")
+            col.prop(props, "path_resolution")
             col.prop(props, "path_offset")
         
         col.prop(props, "avoid_overlap")
         if props.avoid_overlap:
+            col.prop(props, "overlap_mode")
+        if (props.avoid_overlap and props.overlap_mode == 'ITEM') or (props.distribution == 'POISSON' and props.scatter_method in {'SURFACE', 'VOLUME'}):
             col.prop(props, "min_distance")
         
+        # Camera Optimization
+        box = layout.box()
+        box.enabled = editable
+        box.label(text="Camera Optimization", icon="CAMERA_DATA")
+        
+        col = box.column(align=True)
+        col.prop_search(props, "camera_object", context.scene, "objects")
+        col.prop(props, "use_frustum_culling")
+        if props.use_frustum_culling:
+            col.prop(props, "cull_margin")
+        col.prop(props, "use_distance_lod")
+        if props.use_distance_lod:
+            col.prop(props, "lod_distance")
+        
         # Scatter Items
         box = layout.box()
         box.label(text="Scatter Items", icon="OUTLINER_OB_GROUP_INSTANCE")
         
         # Add/Remove buttons
         row = box.row()
+        row.enabled = editable
         row.operator("kdlz.add_scatter_item", icon="ADD")
         row.operator("kdlz.remove_scatter_item", icon="REMOVE")
         
         # List scatter items
         for i, item in enumerate(props.scatter_items):
             box = layout.box()
+            box.enabled = editable
             row = box.row()
             row.label(text=f"Item {i+1}")
+            op = row.operator("kdlz.clear_scatter", text="", icon="X")
+            op.item_index = i
             
             row = box.row()
             row.prop(item, "object")
             
+            if props.use_distance_lod:
+                row = box.row()
+                row.prop(item, "proxy_object")
+            
             row = box.row(align=True)
             row.prop(item, "density")
             
@@ -131,17 +1327,68 @@ class KDLZ_PT_ScatterCraftPanel(bpy.types.Panel):
             row = box.row()
             row.prop(item, "align_to_normal")
             row.prop(item, "random_seed")
+            
+            # Density masks only apply to surface scatter
+            if props.scatter_method == 'SURFACE':
+                col = box.column(align=True)
+                col.prop(item, "mask_type")
+                if item.mask_type == 'VERTEX_GROUP':
+                    target_obj = context.scene.objects.get(props.target_object) if props.target_mode == 'OBJECT' else None
+                    if target_obj:
+                        col.prop_search(item, "mask_vertex_group", target_obj, "vertex_groups")
+                    else:
+                        col.prop(item, "mask_vertex_group")
+                elif item.mask_type == 'IMAGE':
+                    col.prop(item, "mask_image")
+                if item.mask_type != 'NONE':
+                    col.prop(item, "mask_invert")
         
         # Scatter Controls
         box = layout.box()
         box.label(text="Scatter Controls", icon="PLAY")
         
+        box.prop(props, "output_mode")
+        
+        row = box.row(align=True)
+        row.prop(props, "use_multiprocessing")
+        sub = row.row(align=True)
+        sub.enabled = props.use_multiprocessing
+        sub.prop(props, "worker_count")
+        
+        # Status
+        if props.is_scattering:
+            col = box.column(align=True)
+            col.label(text=f"{props.progress_message} {props.progress:.0f}%", icon="SORTTIME")
+            col.label(text="Press Esc to cancel")
+        
+        # Point preview, nothing is created until Execute Scatter
+        col = box.column(align=True)
+        col.prop(props, "show_preview", icon="HIDE_OFF")
+        if props.show_preview:
+            row = col.row(align=True)
+            row.prop(props, "preview_point_size")
+            row.prop(props, "preview_max_points")
+            col.prop(props, "preview_markers")
+            if _preview["error"]:
+                col.label(text=_preview["error"], icon="ERROR")
+            else:
+                count = sum(len(result[1]) for result in _preview["results"])
+                col.label(text=f"Preview: {count} points")
+        
         row = box.row(align=True)
         row.scale_y = 1.5
+        row.enabled = not props.is_scattering
         row.operator("kdlz.execute_scatter", icon="PARTICLES")
         
         row = box.row()
         row.operator("kdlz.clear_scatter", icon="X")
+        
+        # Cache file
+        col = box.column(align=True)
+        col.enabled = not props.is_scattering
+        col.prop(props, "write_cache")
+        col.prop(props, "cache_path", text="")
+        col.operator("kdlz.load_scatter_cache", icon="FILE_REFRESH")
 
 class KDLZ_OT_ScatterCraft(bpy.types.Operator):
     bl_idname = "kdlz.scatter_craft"
@@ -161,7 +1408,8 @@ class KDLZ_OT_AddScatterItem(bpy.types.Operator):
         item = props.scatter_items.add()
         
         # Set default random seed
-        item.random_seed = random.randint(1, 1000)
+        item.random_seed = int(np.random.default_rng().integers(1, 1001))
+        item.uid = uuid.uuid4().hex
         
         return {'FINISHED'}
 
@@ -177,361 +1425,486 @@ class KDLZ_OT_RemoveScatterItem(bpy.types.Operator):
         
         return {'FINISHED'}
 
+class KDLZ_OT_AddScatterTarget(bpy.types.Operator):
+    bl_idname = "kdlz.add_scatter_target"
+    bl_label = "Add Target"
+    
+    def execute(self, context):
+        props = context.scene.kdlz_scatter_props
+        target = props.target_objects.add()
+        
+        # Start from the active mesh if it isn't listed yet
+        obj = context.active_object
+        if obj and obj.type == 'MESH' and all(other.object != obj for other in props.target_objects):
+            target.object = obj
+        
+        return {'FINISHED'}
+
+class KDLZ_OT_RemoveScatterTarget(bpy.types.Operator):
+    bl_idname = "kdlz.remove_scatter_target"
+    bl_label = "Remove Target"
+    
+    index: IntProperty(
+        name="Index",
+        description="Target list entry to remove",
+        default=0
+    )
+    
+    def execute(self, context):
+        props = context.scene.kdlz_scatter_props
+        
+        if 0 <= self.index < len(props.target_objects):
+            props.target_objects.remove(self.index)
+        
+        return {'FINISHED'}
+
+# Instances generated or committed between progress updates
+SCATTER_CHUNK_SIZE = 2000
+
+# Seconds of work per modal timer tick, keeps the UI responsive
+SCATTER_TIME_BUDGET = 0.05
+
+# Share of the progress bar spent generating, the rest is committing
+GENERATE_SHARE = 0.7
+
+# Part of the generating share given to the shared overlap pass, when it runs
+OVERLAP_SHARE = 0.2
+
 class KDLZ_OT_ExecuteScatter(bpy.types.Operator):
     bl_idname = "kdlz.execute_scatter"
     bl_label = "Execute Scatter"
     
-    def execute(self, context):
+    _timer = None
+    _job = None
+    _executor = None
+    _staged = []
+    _summary = ""
+    
+    def validate(self, context):
+        """Return an error message if the scatter can't run, otherwise None"""
         props = context.scene.kdlz_scatter_props
         
-        # Check if we have scatter items
-        if len(props.scatter_items) == 0:
-            self.report({'ERROR'}, "No scatter items defined")
-            return {'CANCELLED'}
+        error = scatter_setup_error(context)
+        if error:
+            return error
+        
+        # Point instancing needs the Named Attribute node
+        if props.output_mode == 'POINTS' and bpy.app.version < (3, 2, 0):
+            return "Point instancing requires Blender 3.2 or newer"
+        
+        if props.write_cache:
+            return cache_path_error(props.cache_path)
+        
+        return None
+    
+    def generate_parallel(self, shared, jobs, worker_count, share):
+        """Generate every item in a process pool, yielding while the workers run"""
+        workers = min(worker_count or os.cpu_count() or 1, len(jobs))
+        
+        # Forking Blender itself isn't safe, workers start a fresh interpreter.
+        # The source buffers go to each worker once, jobs only carry item settings
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(shared,)
+        )
+        futures = [self._executor.submit(generate_worker_transforms, job) for job in jobs]
+        
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.01, return_when=FIRST_COMPLETED)
+            finished = len(futures) - len(pending)
+            yield share * finished / len(futures), f"Generating items in {workers} processes ({finished}/{len(futures)})"
+        
+        self._executor.shutdown()
+        self._executor = None
+        return [future.result() for future in futures]
+    
+    def drive(self, steps, start, span, message):
+        """Run a per-item generator, mapping its progress into the overall range"""
+        while True:
+            try:
+                fraction = next(steps)
+            except StopIteration as done:
+                return done.value
+            yield start + fraction * span, message
+    
+    def run(self, context):
+        """Scatter job, yields (progress, message) after each chunk of work.
+        
+        New objects go into staged collections that only replace the old
+        results once everything is generated, so the job can be abandoned
+        at any yield and rolled back.
+        """
+        props = context.scene.kdlz_scatter_props
+        self._staged = []
+        started = time.perf_counter()
+        first_instance = None
         
         # Create a new collection for scattered objects
-        collection_name = "KDLZ_Scattered_Objects"
-        if collection_name in bpy.data.collections:
-            collection = bpy.data.collections[collection_name]
-        else:
-            collection = bpy.data.collections.new(collection_name)
-            context.scene.collection.children.link(collection)
+        collection = get_scatter_collection(context)
         
-        # Get target for scatter
-        if props.scatter_method == 'SURFACE':
-            # Surface scatter
-            target_obj = bpy.data.objects.get(props.target_object)
-            if not target_obj:
-                self.report({'ERROR'}, "No target object selected")
-                return {'CANCELLED'}
-            
-            # Get target mesh data
-            if target_obj.type != 'MESH':
-                self.report({'ERROR'}, "Target must be a mesh object")
-                return {'CANCELLED'}
-            
-            # Get mesh data
-            mesh = target_obj.data
-            
-            # Get total area of the mesh for density calculations
-            total_area = sum(p.area for p in mesh.polygons)
-            
-            # Create a list of polygons with their accumulated areas
-            accumulated_areas = []
-            accumulated_area = 0
-            for polygon in mesh.polygons:
-                accumulated_area += polygon.area
-                accumulated_areas.append(accumulated_area)
+        # Leftovers from a run that never finished
+        remove_collections(child for child in collection.children if "kdlz_staged_uid" in child)
+        
+        # Source buffers shared by every item's job, masks need the uids
+        ensure_item_uids(props.scatter_items)
+        shared, masks, surface_signature = gather_scatter_sources(context, props)
+        camera = shared["camera"]
+        
+        # Work out which items still match their existing results
+        instancer = find_point_instancer(collection)
+        instanced_uids = set(instancer["kdlz_item_uids"]) if instancer else set()
+        method_signature = (scatter_method_signature(props, surface_signature), camera_signature(camera))
+        
+        keys = {}
+        clean = set()
+        for item in props.scatter_items:
+            # Repainted masks must invalidate the item too
+            mask = masks.get(item.uid)
+            mask_signature = hashlib.sha1(mask.tobytes()).hexdigest() if mask is not None else ""
+            keys[item.uid] = scatter_item_key(props, item, method_signature, mask_signature)
             
-            # Process each scatter item
-            for item in props.scatter_items:
-                if not item.object:
-                    continue
-                
-                # Set random seed
-                random.seed(item.random_seed)
-                
-                # Calculate number of instances based on density and mesh area
-                num_instances = int(total_area * item.density * 10)
-                
-                # Track placed positions for overlap avoidance
-                placed_positions = []
+            if item.object and keys[item.uid] == item.result_key:
+                if props.output_mode == 'POINTS':
+                    has_results = item.uid in instanced_uids
+                else:
+                    has_results = get_item_collection(collection, item.uid, create=False) is not None
+                if has_results:
+                    clean.add(item.uid)
+        
+        dirty = [(item_index, item) for item_index, item in enumerate(props.scatter_items)
+                 if item.object and item.uid not in clean]
+        
+        # Shared overlap makes every item depend on the others
+        use_global_overlap = props.avoid_overlap and props.overlap_mode == 'GLOBAL'
+        if use_global_overlap and dirty:
+            clean = set()
+            dirty = [(item_index, item) for item_index, item in enumerate(props.scatter_items) if item.object]
+        
+        jobs = [build_item_job(props, item, masks.get(item.uid)) for item_index, item in dirty]
+        
+        # The shared overlap pass gets its own slice of the generating progress
+        generate_share = GENERATE_SHARE - OVERLAP_SHARE if use_global_overlap else GENERATE_SHARE
+        
+        # Per-item transforms, written out once every item is generated
+        if props.use_multiprocessing and len(jobs) > 1:
+            transforms = yield from self.generate_parallel(shared, jobs, props.worker_count, generate_share)
+        else:
+            transforms = []
+            span = generate_share / max(len(dirty), 1)
+            for n, ((item_index, item), job) in enumerate(zip(dirty, jobs)):
+                message = f"Generating {item.object.name} ({n + 1}/{len(dirty)})"
+                yield n * span, message
                 
-                # Create instances
-                for i in range(num_instances):
-                    # Select a random face weighted by area
-                    random_area = random.uniform(0, accumulated_area)
-                    polygon_index = 0
-                    for index, area in enumerate(accumulated_areas):
-                        if area >= random_area:
-                            polygon_index = index
-                            break
-                    
-                    polygon = mesh.polygons[polygon_index]
-                    
-                    # Get a random point on the polygon
-                    vertices = [mesh.vertices[v].co for v in polygon.vertices]
-                    if len(vertices) == 3:
-                        # Triangle - simple barycentric coordinates
-                        u = random.random()
-                        v = random.random() * (1 - u)
-                        w = 1 - u - v
-                        point = vertices[0] * u + vertices[1] * v + vertices[2] * w
-                    else:
-                        # N-gon - use center point for simplicity
-                        point = polygon.center
-                    
-                    # Convert to world space
-                    world_point = target_obj.matrix_world @ point
-                    
-                    # Check for overlap
-                    if props.avoid_overlap and placed_positions:
-                        too_close = False
-                        for pos in placed_positions:
-                            if (world_point - pos).length < props.min_distance:
-                                too_close = True
-                                break
-                        if too_close:
-                            continue
-                    
-                    # Add position to placed list
-                    placed_positions.append(world_point)
-                    
-                    # Create instance
-                    obj_copy = item.object.copy()
-                    obj_copy.data = item.object.data
-                    collection.objects.link(obj_copy)
-                    
-                    # Position at point
-                    obj_copy.location = world_point
-                    
-                    # Random rotation
-                    if item.align_to_normal:
-                        # Align Z axis to face normal
-                        normal = target_obj.matrix_world.to_3x3() @ polygon.normal
-                        normal.normalize()
-                        
-                        # Create rotation to align with normal
-                        z_axis = mathutils.Vector((0, 0, 1))
-                        angle = z_axis.angle(normal)
-                        axis = z_axis.cross(normal)
-                        
-                        if axis.length > 0.0001:  # Avoid zero-length axis
-                            axis.normalize()
-                            rot = mathutils.Quaternion(axis, angle)
-                            obj_copy.rotation_euler = rot.to_euler()
-                            
-                            # Add random rotation around normal
-                            random_rot_z = math.radians(random.uniform(item.rotation_min, item.rotation_max))
-                            obj_copy.rotation_euler.rotate_axis('Z', random_rot_z)
-                    else:
-                        # Random rotation on all axes
-                        obj_copy.rotation_euler.x = math.radians(random.uniform(0, 360))
-                        obj_copy.rotation_euler.y = math.radians(random.uniform(0, 360))
-                        obj_copy.rotation_euler.z = math.radians(random.uniform(0, 360))
-                    
-                    # Random scale
-                    random_scale = random.uniform(item.scale_min, item.scale_max)
-                    obj_copy.scale = (random_scale, random_scale, random_scale)
+                steps = item_transform_steps(dict(shared, **job), SCATTER_CHUNK_SIZE)
+                transforms.append((yield from self.drive(steps, n * span, span, message)))
         
-        elif props.scatter_method == 'VOLUME':
-            # Volume scatter
-            volume_size = props.volume_size
-            volume_center = props.volume_center
+        if use_global_overlap:
+            # One scene-wide sphere grid, items claim space in list order
+            batches = overlap_batches(props, [item for item_index, item in dirty], transforms)
+            steps = global_overlap_steps(batches, SCATTER_CHUNK_SIZE)
+            masks = yield from self.drive(steps, generate_share, GENERATE_SHARE - generate_share, "Resolving overlaps between items")
+            transforms = [tuple(values[keep] for values in item_transforms)
+                          for item_transforms, keep in zip(transforms, masks)]
+        
+        results = [(item_index, item) + tuple(item_transforms)
+                   for (item_index, item), item_transforms in zip(dirty, transforms)]
+        generated = time.perf_counter()
+        
+        # Write the generated transforms out
+        if props.output_mode == 'OBJECTS':
+            total = max(sum(len(result[2]) for result in results), 1)
+            done = 0
             
-            # Process each scatter item
-            for item in props.scatter_items:
-                if not item.object:
-                    continue
-                
-                # Set random seed
-                random.seed(item.random_seed)
-                
-                # Calculate number of instances based on density and volume
-                volume = volume_size[0] * volume_size[1] * volume_size[2]
-                num_instances = int(volume * item.density * 5)
+            for item_index, item, locations, rotations, scales, lods in results:
+                staged = bpy.data.collections.new(f"KDLZ_Scatter_{item.object.name}")
+                staged["kdlz_staged_uid"] = item.uid
+                collection.children.link(staged)
+                self._staged.append(staged)
                 
-                # Track placed positions for overlap avoidance
-                placed_positions = []
-                
-                # Create instances
-                for i in range(num_instances):
-                    # Random position within volume
-                    x = random.uniform(-volume_size[0]/2, volume_size[0]/2) + volume_center[0]
-                    y = random.uniform(-volume_size[1]/2, volume_size[1]/2) + volume_center[1]
-                    z = random.uniform(-volume_size[2]/2, volume_size[2]/2) + volume_center[2]
-                    point = mathutils.Vector((x, y, z))
-                    
-                    # Check for overlap
-                    if props.avoid_overlap and placed_positions:
-                        too_close = False
-                        for pos in placed_positions:
-                            if (point - pos).length < props.min_distance:
-                                too_close = True
-                                break
-                        if too_close:
-                            continue
-                    
-                    # Add position to placed list
-                    placed_positions.append(point)
-                    
-                    # Create instance
-                    obj_copy = item.object.copy()
-                    obj_copy.data = item.object.data
-                    collection.objects.link(obj_copy)
-                    
-                    # Position at point
-                    obj_copy.location = point
-                    
-                    # Random rotation
-                    obj_copy.rotation_euler.x = math.radians(random.uniform(0, 360))
-                    obj_copy.rotation_euler.y = math.radians(random.uniform(0, 360))
-                    obj_copy.rotation_euler.z = math.radians(random.uniform(item.rotation_min, item.rotation_max))
-                    
-                    # Random scale
-                    random_scale = random.uniform(item.scale_min, item.scale_max)
-                    obj_copy.scale = (random_scale, random_scale, random_scale)
+                # Link one chunk of instances per step
+                for linked in link_instance_chunks(staged, item, (locations, rotations, scales, lods)):
+                    done += linked
+                    if first_instance is None:
+                        first_instance = time.perf_counter()
+                    yield GENERATE_SHARE + (1.0 - GENERATE_SHARE) * done / total, f"Creating instances ({done}/{total})"
         
-        elif props.scatter_method == 'PATH':
-            # Path scatter
-            path_obj = bpy.data.objects.get(props.path_object)
-            if not path_obj:
-                self.report({'ERROR'}, "No path object selected")
-                return {'CANCELLED'}
+        # Swap the new results in, nothing below can be cancelled
+        stale = []
+        for child in collection.children:
+            uid = child.get("kdlz_item_uid")
+            if uid is None:
+                continue
+            if props.output_mode == 'POINTS' or uid not in clean:
+                stale.append(child)
+        remove_collections(stale)
+        
+        if props.output_mode == 'POINTS':
+            # Keep the clean items' points and replace everything else
+            entries = read_point_instancer(instancer) if instancer else {}
+            entries = {uid: entry for uid, entry in entries.items() if uid in clean}
+            for item_index, item, locations, rotations, scales, lods in results:
+                entries[item.uid] = (locations, rotations, scales, lods)
             
-            # Check if path object has splines (is a curve)
-            if path_obj.type != 'CURVE':
-                self.report({'ERROR'}, "Path object must be a curve")
-                return {'CANCELLED'}
+            write_point_instancer(collection, props.scatter_items, entries)
+            first_instance = time.perf_counter()
+        else:
+            if instancer:
+                remove_objects([instancer])
             
-            # Process each scatter item
-            for item in props.scatter_items:
-                if not item.object:
-                    continue
-                
-                # Set random seed
-                random.seed(item.random_seed)
-                
-                # Get curve data
-                curve = path_obj.data
-                
-                # Process each spline in the curve
-                for spline in curve.splines:
-                    # Calculate spline length (approximate)
-                    points = []
-                    if spline.type == 'BEZIER':
-                        points = [p.co for p in spline.bezier_points]
-                    else:
-                        points = [p.co for p in spline.points]
-                    
-                    # Calculate segments and total length
-                    segments = []
-                    total_length = 0
-                    for i in range(1, len(points)):
-                        segment_length = (points[i] - points[i-1]).length
-                        segments.append((points[i-1], points[i], segment_length))
-                        total_length += segment_length
-                    
-                    # Calculate number of instances based on density and path length
-                    num_instances = int(total_length * item.density * 2)
-                    
-                    # Track placed positions for overlap avoidance
-                    placed_positions = []
-                    
-                    # Create instances along path
-                    for i in range(num_instances):
-                        # Choose a random position along the path
-                        random_dist = random.uniform(0, total_length)
-                        
-                        # Find the segment that contains this position
-                        current_dist = 0
-                        segment_start = mathutils.Vector((0, 0, 0))
-                        segment_end = mathutils.Vector((0, 0, 0))
-                        segment_length = 0
-                        
-                        for start, end, length in segments:
-                            if current_dist + length >= random_dist:
-                                segment_start = start
-                                segment_end = end
-                                segment_length = length
-                                break
-                            current_dist += length
-                        
-                        # Calculate position on segment
-                        segment_pos = (random_dist - current_dist) / segment_length
-                        point = segment_start.lerp(segment_end, segment_pos)
-                        
-                        # Convert to world space
-                        world_point = path_obj.matrix_world @ point
-                        
-                        # Apply path offset
-                        if props.path_offset > 0:
-                            # Calculate direction vector perpendicular to path
-                            direction = segment_end - segment_start
-                            if direction.length > 0:
-                                direction.normalize()
-                                
-                                # Create perpendicular vector (in XY plane for simplicity)
-                                perp = mathutils.Vector((-direction.y, direction.x, 0))
-                                perp.normalize()
-                                
-                                # Apply random offset
-                                random_offset = random.uniform(-props.path_offset, props.path_offset)
-                                world_point += perp * random_offset
-                        
-                        # Check for overlap
-                        if props.avoid_overlap and placed_positions:
-                            too_close = False
-                            for pos in placed_positions:
-                                if (world_point - pos).length < props.min_distance:
-                                    too_close = True
-                                    break
-                            if too_close:
-                                continue
-                        
-                        # Add position to placed list
-                        placed_positions.append(world_point)
-                        
-                        # Create instance
-                        obj_copy = item.object.copy()
-                        obj_copy.data = item.object.data
-                        collection.objects.link(obj_copy)
-                        
-                        # Position at point
-                        obj_copy.location = world_point
-                        
-                        # Rotation - align to path direction
-                        if item.align_to_normal and direction.length > 0:
-                            # Create rotation to align with path direction
-                            z_axis = mathutils.Vector((0, 0, 1))
-                            y_axis = mathutils.Vector((0, 1, 0))
-                            
-                            # Align Y axis with path direction
-                            angle_y = y_axis.angle(direction)
-                            axis_y = y_axis.cross(direction)
-                            
-                            if axis_y.length > 0.0001:  # Avoid zero-length axis
-                                axis_y.normalize()
-                                rot = mathutils.Quaternion(axis_y, angle_y)
-                                obj_copy.rotation_euler = rot.to_euler()
-                                
-                                # Add random rotation around Y axis
-                                random_rot_y = math.radians(random.uniform(item.rotation_min, item.rotation_max))
-                                obj_copy.rotation_euler.rotate_axis('Y', random_rot_y)
-                        else:
-                            # Random rotation on all axes
-                            obj_copy.rotation_euler.x = math.radians(random.uniform(0, 360))
-                            obj_copy.rotation_euler.y = math.radians(random.uniform(0, 360))
-                            obj_copy.rotation_euler.z = math.radians(random.uniform(0, 360))
-                        
-                        # Random scale
-                        random_scale = random.uniform(item.scale_min, item.scale_max)
-                        obj_copy.scale = (random_scale, random_scale, random_scale)
-        
-        self.report({'INFO'}, f"Scatter completed. Objects placed in collection '{collection_name}'")
+            for staged in self._staged:
+                staged["kdlz_item_uid"] = staged["kdlz_staged_uid"]
+                del staged["kdlz_staged_uid"]
+            self._staged = []
+        
+        # Remember what each regenerated item was built from
+        for item_index, item, locations, rotations, scales, lods in results:
+            item.result_key = keys[item.uid]
+        
+        # Keep a copy of every item's transforms on disk
+        if props.write_cache:
+            if props.output_mode == 'OBJECTS':
+                entries = {}
+                for item in props.scatter_items:
+                    child = get_item_collection(collection, item.uid, create=False)
+                    if child and item.object:
+                        entries[item.uid] = read_item_collection(child, item)
+            
+            parameters = property_values(props, skip={"is_scattering", "progress", "progress_message"})
+            save_scatter_cache(bpy.path.abspath(props.cache_path), props.scatter_items, entries, parameters)
+        
+        finished = time.perf_counter()
+        instances = sum(len(result[2]) for result in results)
+        last_scatter_stats.clear()
+        last_scatter_stats.update(
+            items_regenerated=len(results),
+            items_unchanged=len(clean),
+            instances=instances,
+            generate_seconds=generated - started,
+            first_instance_seconds=(first_instance or finished) - started,
+            total_seconds=finished - started
+        )
+        
+        self._summary = f"Scatter completed: {len(results)} item(s) regenerated, {len(clean)} unchanged. Objects placed in collection '{collection.name}'"
+    
+    def rollback(self, context):
+        """Remove everything the interrupted job created"""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
+        remove_collections(self._staged)
+        self._staged = []
+    
+    def execute(self, context):
+        error = self.validate(context)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        # Run the whole job in one go (scripts, background mode)
+        self._job = self.run(context)
+        try:
+            for _ in self._job:
+                pass
+        except Exception:
+            self.rollback(context)
+            raise
+        
+        self.report({'INFO'}, self._summary)
         return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        props = context.scene.kdlz_scatter_props
+        
+        error = self.validate(context)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        # Set scattering flag
+        props.is_scattering = True
+        props.progress = 0
+        props.progress_message = "Starting scatter..."
+        
+        self._job = self.run(context)
+        
+        # Start timer
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        props = context.scene.kdlz_scatter_props
+        
+        if event.type == 'ESC':
+            self.rollback(context)
+            self.report({'WARNING'}, "Scatter cancelled")
+            return self.cancel(context)
+        
+        if event.type == 'TIMER':
+            # Work through chunks until this tick's time budget is spent
+            deadline = time.perf_counter() + SCATTER_TIME_BUDGET
+            try:
+                while time.perf_counter() < deadline:
+                    progress, message = next(self._job)
+            except StopIteration:
+                self.report({'INFO'}, self._summary)
+                self.cancel(context)
+                return {'FINISHED'}
+            except Exception as e:
+                self.rollback(context)
+                self.report({'ERROR'}, f"Error during scatter: {str(e)}")
+                return self.cancel(context)
+            
+            props.progress = progress * 100.0
+            props.progress_message = message
+            
+            # Redraw the sidebar so the progress shows
+            if context.screen:
+                for area in context.screen.areas:
+                    if area.type == 'VIEW_3D':
+                        area.tag_redraw()
+        
+        return {'PASS_THROUGH'}
+    
+    def cancel(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        
+        # Blender cancels modal operators on file load or window close
+        self.rollback(context)
+        context.scene.kdlz_scatter_props.is_scattering = False
+        
+        return {'CANCELLED'}
 
 class KDLZ_OT_ClearScatter(bpy.types.Operator):
     bl_idname = "kdlz.clear_scatter"
     bl_label = "Clear Scattered Objects"
     
+    item_index: IntProperty(
+        name="Item Index",
+        description="Scatter item to clear, -1 clears the results of every item",
+        default=-1,
+        options={'SKIP_SAVE'}
+    )
+    
     def execute(self, context):
+        props = context.scene.kdlz_scatter_props
         collection_name = "KDLZ_Scattered_Objects"
         
-        if collection_name in bpy.data.collections:
-            collection = bpy.data.collections[collection_name]
-            
-            # Remove all objects in the collection
-            for obj in list(collection.objects):
-                bpy.data.objects.remove(obj, do_unlink=True)
+        collection = bpy.data.collections.get(collection_name)
+        if collection is None:
+            self.report({'INFO'}, "No scattered objects to clear")
+            return {'FINISHED'}
+        
+        if props.is_scattering:
+            self.report({'ERROR'}, "Can't clear while a scatter job is running")
+            return {'CANCELLED'}
+        
+        if self.item_index >= 0:
+            if self.item_index >= len(props.scatter_items):
+                self.report({'ERROR'}, "Invalid scatter item")
+                return {'CANCELLED'}
             
-            # Remove the collection
-            bpy.data.collections.remove(collection)
+            # Only this item's collection or points go
+            item = props.scatter_items[self.item_index]
+            clear_item_results(collection, props.scatter_items, item.uid)
+            item.result_key = ""
             
-            self.report({'INFO'}, "Cleared all scattered objects")
+            self.report({'INFO'}, f"Cleared scattered objects of item {self.item_index + 1}")
+            return {'FINISHED'}
+        
+        # Remove the whole run: every item collection, the instancer and the root
+        remove_collections([collection])
+        
+        # Nothing is left to reuse on the next scatter
+        for item in props.scatter_items:
+            item.result_key = ""
+        
+        self.report({'INFO'}, "Cleared all scattered objects")
+        return {'FINISHED'}
+
+class KDLZ_OT_LoadScatterCache(bpy.types.Operator):
+    bl_idname = "kdlz.load_scatter_cache"
+    bl_label = "Load Scatter Cache"
+    
+    def execute(self, context):
+        props = context.scene.kdlz_scatter_props
+        
+        if props.is_scattering:
+            self.report({'ERROR'}, "Can't load a cache while a scatter job is running")
+            return {'CANCELLED'}
+        
+        error = cache_path_error(props.cache_path)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        
+        path = bpy.path.abspath(props.cache_path)
+        if not os.path.isfile(path):
+            self.report({'ERROR'}, f"Scatter cache not found: {path}")
+            return {'CANCELLED'}
+        
+        if props.output_mode == 'POINTS' and bpy.app.version < (3, 2, 0):
+            self.report({'ERROR'}, "Point instancing requires Blender 3.2 or newer")
+            return {'CANCELLED'}
+        
+        try:
+            cached = load_scatter_cache(path)
+        except (OSError, ValueError, KeyError) as e:
+            self.report({'ERROR'}, f"Couldn't read scatter cache: {str(e)}")
+            return {'CANCELLED'}
+        
+        # Match cached items by uid, or by object name in another file
+        by_uid = {item.uid: item for item in props.scatter_items if item.object}
+        matched = []
+        skipped = 0
+        for uid, object_name, result_key, entry in cached:
+            item = by_uid.pop(uid, None)
+            if item is None:
+                item = next((other for other in by_uid.values() if other.object.name == object_name), None)
+                if item is not None:
+                    del by_uid[item.uid]
+            if item is None:
+                skipped += 1
+                continue
+            matched.append((item, result_key, entry))
+        
+        if not matched:
+            self.report({'ERROR'}, "No scatter items match the cache")
+            return {'CANCELLED'}
+        
+        # Replace the current results
+        collection = get_scatter_collection(context)
+        remove_collections(list(collection.children))
+        remove_objects(collection.objects)
+        for item in props.scatter_items:
+            item.result_key = ""
+        
+        if props.output_mode == 'POINTS':
+            write_point_instancer(collection, props.scatter_items, {item.uid: entry for item, result_key, entry in matched})
         else:
-            self.report({'INFO'}, "No scattered objects to clear")
+            for item, result_key, entry in matched:
+                child = get_item_collection(collection, item.uid)
+                child.name = f"KDLZ_Scatter_{item.object.name}"
+                for _ in link_instance_chunks(child, item, entry):
+                    pass
         
+        # Unchanged settings keep the loaded results on the next scatter
+        for item, result_key, entry in matched:
+            item.result_key = result_key
+        
+        instances = sum(len(entry[0]) for item, result_key, entry in matched)
+        message = f"Loaded {instances} instances for {len(matched)} item(s)"
+        if skipped:
+            message += f", {skipped} cached item(s) had no match"
+        self.report({'INFO'}, message)
         return {'FINISHED'}
 
 class KDLZ_ScatterProps(bpy.types.PropertyGroup):
@@ -545,11 +1918,63 @@ class KDLZ_ScatterProps(bpy.types.PropertyGroup):
         default='SURFACE'
     )
     
+    distribution: EnumProperty(
+        name="Distribution",
+        items=[
+            ('RANDOM', "Random", "Independent random points, optionally thinned by overlap avoidance"),
+            ('POISSON', "Poisson Disk", "Evenly spaced blue-noise points at Min Distance, filled to maximum density")
+        ],
+        default='RANDOM'
+    )
+    
+    target_mode: EnumProperty(
+        name="Targets",
+        items=[
+            ('OBJECT', "Object", "Scatter on a single mesh"),
+            ('LIST', "Object List", "Scatter across several meshes as one surface"),
+            ('COLLECTION', "Collection", "Scatter across every mesh in a collection as one surface")
+        ],
+        default='OBJECT'
+    )
+    
+    target_objects: CollectionProperty(
+        type=KDLZ_ScatterTarget,
+        name="Target Objects"
+    )
+    
+    target_collection: PointerProperty(
+        name="Target Collection",
+        type=bpy.types.Collection,
+        description="Collection whose meshes are scattered on"
+    )
+    
     target_object: StringProperty(
         name="Target Object",
         description="Object to scatter on"
     )
     
+    volume_shape: EnumProperty(
+        name="Volume Shape",
+        items=[
+            ('BOX', "Box", "Fill the box given by Volume Size and Volume Center"),
+            ('MESH', "Mesh", "Fill the inside of a closed mesh")
+        ],
+        default='BOX'
+    )
+    
+    volume_object: StringProperty(
+        name="Volume Object",
+        description="Closed mesh to scatter inside"
+    )
+    
+    volume_resolution: IntProperty(
+        name="Voxel Resolution",
+        description="Inside/outside grid cells along the longest side of the volume mesh",
+        default=64,
+        min=8,
+        max=512
+    )
+    
     volume_size: bpy.props.FloatVectorProperty(
         name="Volume Size",
         description="Size of the volume to scatter in",
@@ -568,6 +1993,14 @@ class KDLZ_ScatterProps(bpy.types.PropertyGroup):
         description="Curve to scatter along"
     )
     
+    path_resolution: IntProperty(
+        name="Path Resolution",
+        description="Samples per spline segment when evaluating the path",
+        default=12,
+        min=1,
+        max=256
+    )
+    
     path_offset: FloatProperty(
         name="Path Offset",
         description="Random offset from path",
@@ -582,6 +2015,15 @@ class KDLZ_ScatterProps(bpy.types.PropertyGroup):
         default=True
     )
     
+    overlap_mode: EnumProperty(
+        name="Overlap Between",
+        items=[
+            ('ITEM', "Same Item", "Keep instances of each item Min Distance apart, items may overlap each other"),
+            ('GLOBAL', "All Items", "Keep every instance clear of all others, with radii taken from each object's bounds")
+        ],
+        default='ITEM'
+    )
+    
     min_distance: FloatProperty(
         name="Min Distance",
         description="Minimum distance between scattered objects",
@@ -590,29 +2032,179 @@ class KDLZ_ScatterProps(bpy.types.PropertyGroup):
         max=10.0
     )
     
+    camera_object: StringProperty(
+        name="Camera",
+        description="Camera for culling and LOD, the scene camera when empty"
+    )
+    
+    use_frustum_culling: BoolProperty(
+        name="Frustum Culling",
+        description="Skip instances outside the camera view",
+        default=False
+    )
+    
+    cull_margin: FloatProperty(
+        name="Margin",
+        description="Extra border around the camera frame kept when culling, as a fraction of the frame",
+        default=0.1,
+        min=0.0,
+        max=2.0,
+        subtype='FACTOR'
+    )
+    
+    use_distance_lod: BoolProperty(
+        name="Distance LOD",
+        description="Use each item's proxy object for instances far from the camera",
+        default=False
+    )
+    
+    lod_distance: FloatProperty(
+        name="LOD Distance",
+        description="Distance from the camera beyond which instances use the proxy",
+        default=50.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    
     scatter_items: CollectionProperty(
         type=KDLZ_ScatterItem,
         name="Scatter Items"
     )
+    
+    # Status tracking
+    is_scattering: BoolProperty(
+        name="Is Scattering",
+        description="Whether a scatter job is currently running",
+        default=False
+    )
+    
+    progress: FloatProperty(
+        name="Progress",
+        description="Scatter progress",
+        default=0.0,
+        min=0.0,
+        max=100.0,
+        subtype='PERCENTAGE'
+    )
+    
+    progress_message: StringProperty(
+        name="Progress Message",
+        description="Current status of the scatter job",
+        default=""
+    )
+    
+    output_mode: EnumProperty(
+        name="Output",
+        items=[
+            ('OBJECTS', "Objects", "Create a linked-duplicate object per instance"),
+            ('POINTS', "Point Instances", "Write all instances into one point cloud instanced through Geometry Nodes")
+        ],
+        default='OBJECTS'
+    )
+    
+    write_cache: BoolProperty(
+        name="Write Scatter Cache",
+        description="Save every item's transforms to a cache file after each scatter",
+        default=False
+    )
+    
+    cache_path: StringProperty(
+        name="Cache File",
+        description="Scatter cache file (.npz), relative paths start next to the .blend file",
+        default="//kdlz_scatter_cache.npz",
+        subtype='FILE_PATH'
+    )
+    
+    show_preview: BoolProperty(
+        name="Show Preview",
+        description="Draw the sampled points in the viewport without creating any instances",
+        default=False,
+        update=update_show_preview
+    )
+    
+    preview_markers: BoolProperty(
+        name="Orientation Markers",
+        description="Draw a line along each preview point's up axis, as tall as its item",
+        default=False,
+        update=update_preview_drawing
+    )
+    
+    preview_point_size: FloatProperty(
+        name="Point Size",
+        description="Size of the preview points in pixels",
+        default=4.0,
+        min=1.0,
+        max=20.0,
+        update=update_preview_drawing
+    )
+    
+    preview_max_points: IntProperty(
+        name="Max Points",
+        description="Most points drawn by the preview, larger scatters are thinned evenly",
+        default=100000,
+        min=1000,
+        update=update_preview_drawing
+    )
+    
+    use_multiprocessing: BoolProperty(
+        name="Parallel Items",
+        description="Generate scatter items in separate worker processes",
+        default=False
+    )
+    
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of worker processes, 0 uses every CPU core",
+        default=0,
+        min=0,
+        max=64
+    )
 
 def register():
     bpy.utils.register_class(KDLZ_ScatterItem)
+    bpy.utils.register_class(KDLZ_ScatterTarget)
     bpy.utils.register_class(KDLZ_PT_ScatterCraftPanel)
     bpy.utils.register_class(KDLZ_OT_ScatterCraft)
     bpy.utils.register_class(KDLZ_OT_AddScatterItem)
     bpy.utils.register_class(KDLZ_OT_RemoveScatterItem)
+    bpy.utils.register_class(KDLZ_OT_AddScatterTarget)
+    bpy.utils.register_class(KDLZ_OT_RemoveScatterTarget)
     bpy.utils.register_class(KDLZ_OT_ExecuteScatter)
     bpy.utils.register_class(KDLZ_OT_ClearScatter)
+    bpy.utils.register_class(KDLZ_OT_LoadScatterCache)
     bpy.utils.register_class(KDLZ_ScatterProps)
     bpy.types.Scene.kdlz_scatter_props = bpy.props.PointerProperty(type=KDLZ_ScatterProps)
+    bpy.app.handlers.load_post.append(clear_scatter_caches)
+    bpy.app.handlers.load_post.append(reset_scatter_state)
+    bpy.app.handlers.load_post.append(scatter_preview_load)
+    bpy.app.handlers.depsgraph_update_post.append(scatter_preview_depsgraph)
 
 def unregister():
+    for handler in (clear_scatter_caches, reset_scatter_state, scatter_preview_load):
+        if handler in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(handler)
+    if scatter_preview_depsgraph in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(scatter_preview_depsgraph)
+    clear_scatter_caches()
+    
+    # Stop drawing and resampling the preview
+    if _preview["handler"] is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(_preview["handler"], 'WINDOW')
+        _preview["handler"] = None
+    if bpy.app.timers.is_registered(refresh_scatter_preview):
+        bpy.app.timers.unregister(refresh_scatter_preview)
+    _preview.update(results=[], batches=None, error="", settings=None)
+    
     bpy.utils.unregister_class(KDLZ_PT_ScatterCraftPanel)
     bpy.utils.unregister_class(KDLZ_OT_ScatterCraft)
     bpy.utils.unregister_class(KDLZ_OT_AddScatterItem)
     bpy.utils.unregister_class(KDLZ_OT_RemoveScatterItem)
+    bpy.utils.unregister_class(KDLZ_OT_AddScatterTarget)
+    bpy.utils.unregister_class(KDLZ_OT_RemoveScatterTarget)
     bpy.utils.unregister_class(KDLZ_OT_ExecuteScatter)
     bpy.utils.unregister_class(KDLZ_OT_ClearScatter)
+    bpy.utils.unregister_class(KDLZ_OT_LoadScatterCache)
     bpy.utils.unregister_class(KDLZ_ScatterProps)
+    bpy.utils.unregister_class(KDLZ_ScatterTarget)
     bpy.utils.unregister_class(KDLZ_ScatterItem)
     del bpy.types.Scene.kdlz_scatter_props
@@ -0,0 +1,899 @@
+"""NumPy sampling helpers for ScatterCraft.
+
+Everything in here works on plain arrays and never touches bpy, so the
+operators gather mesh buffers once and hand them over in bulk.
+"""
+import math
+
+import numpy as np
+
+
+def triangle_table(verts, tris):
+    """Build the area table for a triangle soup.
+
+    Returns per-triangle areas, unit normals and the cumulative area
+    distribution used to pick triangles proportionally to their size.
+    """
+    a = verts[tris[:, 0]]
+    b = verts[tris[:, 1]]
+    c = verts[tris[:, 2]]
+
+    cross = np.cross(b - a, c - a)
+    lengths = np.linalg.norm(cross, axis=1)
+    areas = 0.5 * lengths
+
+    # Degenerate triangles get a zero normal and zero weight
+    normals = np.zeros_like(cross)
+    valid = lengths > 0.0
+    normals[valid] = cross[valid] / lengths[valid, None]
+
+    cdf = np.cumsum(areas, dtype=np.float64)
+    return areas, normals, cdf
+
+
+def sample_triangles(verts, tris, normals, cdf, count, rng):
+    """Pick `count` uniformly distributed points on the triangles.
+
+    Triangles are chosen by area through a binary search on `cdf`, then
+    every point is placed with uniform barycentric coordinates in one pass.
+    Returns the points, their triangle normals and the triangle indices.
+    """
+    if count <= 0 or len(cdf) == 0 or cdf[-1] <= 0.0:
+        empty = np.empty((0, 3), dtype=np.float64)
+        return empty, empty.copy(), np.empty(0, dtype=np.int64)
+
+    picks = rng.random(count) * cdf[-1]
+    face_index = np.searchsorted(cdf, picks, side='right')
+    np.minimum(face_index, len(cdf) - 1, out=face_index)
+
+    # Square-root warp keeps the barycentric samples uniform over the area
+    r1 = np.sqrt(rng.random(count))[:, None]
+    r2 = rng.random(count)[:, None]
+
+    corners = tris[face_index]
+    a = verts[corners[:, 0]]
+    b = verts[corners[:, 1]]
+    c = verts[corners[:, 2]]
+    points = (1.0 - r1) * a + r1 * (1.0 - r2) * b + r1 * r2 * c
+
+    return points, normals[face_index], face_index
+
+
+def transform_points(points, matrix):
+    """Apply a 4x4 matrix to an (N, 3) array of points"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def transform_normals(normals, matrix):
+    """Apply the normal matrix of a 4x4 transform and renormalize"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    normal_matrix = np.linalg.inv(matrix[:3, :3]).T
+    result = normals @ normal_matrix.T
+
+    lengths = np.linalg.norm(result, axis=1)
+    valid = lengths > 0.0
+    result[valid] /= lengths[valid, None]
+    return result
+
+
+def merge_surface_targets(parts):
+    """Combine several targets into one world-space (verts, tris, areas, normals, cdf) table.
+
+    `parts` holds (table, matrix_world) per target, where a table starts
+    with local verts and tris. Areas are measured after each object's
+    transform, so the merged CDF spreads instances evenly across targets
+    of any scale.
+    """
+    verts = []
+    tris = []
+    offset = 0
+    for table, matrix_world in parts:
+        verts.append(transform_points(table[0], matrix_world))
+        tris.append(table[1] + offset)
+        offset += len(table[0])
+
+    verts = np.concatenate(verts)
+    tris = np.concatenate(tris)
+    areas, normals, cdf = triangle_table(verts, tris)
+    return verts, tris, areas, normals, cdf
+
+
+class SpatialHashGrid:
+    """Uniform hash grid for minimum-distance tests.
+
+    The cell size equals the minimum distance, so any point closer than
+    that lives in one of the 27 cells around the query point.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+
+    def _key(self, point):
+        size = self.cell_size
+        return (math.floor(point[0] / size),
+                math.floor(point[1] / size),
+                math.floor(point[2] / size))
+
+    def is_clear(self, point):
+        """Return True if no stored point is closer than the cell size"""
+        kx, ky, kz = self._key(point)
+        limit = self.cell_size * self.cell_size
+        px, py, pz = point[0], point[1], point[2]
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    bucket = self.cells.get((kx + dx, ky + dy, kz + dz))
+                    if not bucket:
+                        continue
+                    for qx, qy, qz in bucket:
+                        ex, ey, ez = px - qx, py - qy, pz - qz
+                        if ex * ex + ey * ey + ez * ez < limit:
+                            return False
+        return True
+
+    def insert(self, point):
+        """Store a point in its cell"""
+        self.cells.setdefault(self._key(point), []).append(
+            (float(point[0]), float(point[1]), float(point[2])))
+
+    def try_insert(self, point):
+        """Insert the point only if it keeps the minimum distance"""
+        if not self.is_clear(point):
+            return False
+        self.insert(point)
+        return True
+
+
+class RadiusHashGrid(SpatialHashGrid):
+    """Hash grid of spheres for overlap tests between differently sized instances.
+
+    Two spheres collide when their centers are closer than the sum of their
+    radii. The cell size must be at least twice the largest radius, so every
+    possible collider lives in the 27 cells around the query point.
+    """
+
+    def is_clear(self, point, radius):
+        """Return True if the sphere touches none of the stored ones"""
+        kx, ky, kz = self._key(point)
+        px, py, pz = point[0], point[1], point[2]
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    bucket = self.cells.get((kx + dx, ky + dy, kz + dz))
+                    if not bucket:
+                        continue
+                    for qx, qy, qz, qr in bucket:
+                        ex, ey, ez = px - qx, py - qy, pz - qz
+                        reach = radius + qr
+                        if ex * ex + ey * ey + ez * ez < reach * reach:
+                            return False
+        return True
+
+    def insert(self, point, radius):
+        """Store a sphere in the cell of its center"""
+        self.cells.setdefault(self._key(point), []).append(
+            (float(point[0]), float(point[1]), float(point[2]), float(radius)))
+
+    def try_insert(self, point, radius):
+        """Insert the sphere only if it overlaps nothing stored"""
+        if not self.is_clear(point, radius):
+            return False
+        self.insert(point, radius)
+        return True
+
+
+def global_overlap_steps(batches, chunk_size=2000):
+    """Filter several items' instances against one shared sphere grid.
+
+    `batches` holds (points, radii) per item, in priority order: earlier
+    items claim their space first. Yields progress fractions and returns
+    one keep mask per batch.
+    """
+    radii = [batch_radii.max() for _, batch_radii in batches if len(batch_radii)]
+    grid = RadiusHashGrid(max(2.0 * max(radii, default=0.0), 1e-6))
+
+    total = max(sum(len(points) for points, _ in batches), 1)
+    done = 0
+    masks = []
+    for points, batch_radii in batches:
+        keep = np.zeros(len(points), dtype=bool)
+        for index, (point, radius) in enumerate(zip(points.tolist(), batch_radii.tolist())):
+            if done and done % chunk_size == 0:
+                yield done / total
+            done += 1
+            keep[index] = grid.try_insert(point, radius)
+        masks.append(keep)
+    return masks
+
+
+# Candidates per r^2 of surface area for surface Poisson-disk sampling.
+# A maximal packing holds roughly 0.7 points per r^2, so this leaves plenty
+# of darts for the gaps to fill up.
+POISSON_SURFACE_OVERSAMPLE = 12.0
+
+# Candidates per r^3 of volume for box Poisson-disk sampling. Random
+# packings saturate near 0.7 points per r^3, the rest of the pool goes into
+# the last gaps.
+POISSON_VOLUME_OVERSAMPLE = 20.0
+
+# Upper bound on a Poisson candidate pool to keep memory and time in check
+POISSON_MAX_CANDIDATES = 5000000
+
+
+def poisson_disk_darts(draw, pool, radius, limit=None, chunk_size=2000):
+    """Dart throwing over a lazily drawn candidate pool.
+
+    `draw(count)` returns that many random candidates as rows with the
+    position in the first three columns, further columns (normals, say)
+    ride along. They are drawn `chunk_size` at a time and each one at
+    least `radius` away from everything kept so far is kept, until `limit`
+    points are in or `pool` candidates have been tried. Yields progress
+    fractions between chunks and returns the kept rows.
+    """
+    target = pool if limit is None else min(limit, pool)
+    if target <= 0:
+        return np.empty((0, 3), dtype=np.float64)
+
+    grid = SpatialHashGrid(radius)
+    kept = []
+    columns = 3
+    drawn = 0
+    while drawn < pool and len(kept) < target:
+        candidates = draw(min(chunk_size, pool - drawn))
+        drawn += len(candidates)
+        columns = candidates.shape[1]
+        for point in candidates.tolist():
+            if grid.try_insert(point):
+                kept.append(point)
+                if len(kept) >= target:
+                    break
+        yield max(drawn / pool, len(kept) / target)
+
+    return np.array(kept, dtype=np.float64).reshape(-1, columns)
+
+
+def poisson_disk_box(size, radius, rng, limit=None, chunk_size=2000):
+    """Poisson-disk sampling inside an axis-aligned box.
+
+    Dart throwing over uniform candidates in [0, size), with a pool sized
+    from the box volume and the radius. The candidates come in random
+    order, so stopping at `limit` still spreads the points over the whole
+    box and the work grows with `limit`, not with how many points the
+    box could hold. Yields progress fractions and returns the points.
+    """
+    size = np.asarray(size, dtype=np.float64)
+    radius = float(radius)
+    pool = int(POISSON_VOLUME_OVERSAMPLE * float(np.prod(size)) / radius ** 3) + 1
+    pool = min(pool, POISSON_MAX_CANDIDATES)
+    points = yield from poisson_disk_darts(lambda count: rng.random((count, 3)) * size, pool, radius, limit, chunk_size)
+    return points
+
+
+def poisson_disk_surface(verts, tris, radius, rng, limit=None, weights=None, chunk_size=2000):
+    """Poisson-disk points on a triangle soup.
+
+    Dart throwing over area-weighted candidates, drawn a chunk at a time
+    from a pool sized from the surface area and the radius. The candidates
+    come in random order, so stopping at `limit` still spreads the points
+    over the whole surface. Optional per-triangle `weights` mask the
+    pool. Yields progress fractions and returns the points and their
+    triangle normals.
+    """
+    areas, normals, cdf = triangle_table(verts, tris)
+    if weights is not None:
+        cdf = weighted_cdf(areas, weights)
+    if len(cdf) == 0 or cdf[-1] <= 0.0:
+        empty = np.empty((0, 3), dtype=np.float64)
+        return empty, empty.copy()
+
+    def draw(count):
+        points, point_normals, _ = sample_triangles(verts, tris, normals, cdf, count, rng)
+        return np.hstack((points, point_normals))
+
+    pool = int(POISSON_SURFACE_OVERSAMPLE * cdf[-1] / (radius * radius)) + 1
+    pool = min(pool, POISSON_MAX_CANDIDATES)
+    kept = yield from poisson_disk_darts(draw, pool, radius, limit, chunk_size)
+    return kept[:, :3], kept[:, 3:].reshape(-1, 3)
+
+
+def bezier_polyline(points, handles_left, handles_right, cyclic, resolution):
+    """Evaluate a cubic Bezier spline into a dense polyline.
+
+    Each segment gets `resolution` samples, evaluated for all segments at
+    once. The end point is appended so open splines end exactly on their
+    last control point.
+    """
+    if cyclic:
+        starts = np.arange(len(points))
+    else:
+        starts = np.arange(len(points) - 1)
+    if len(starts) == 0:
+        return points[:1].copy()
+    ends = (starts + 1) % len(points)
+
+    p0 = points[starts][:, None, :]
+    p1 = handles_right[starts][:, None, :]
+    p2 = handles_left[ends][:, None, :]
+    p3 = points[ends][:, None, :]
+
+    t = (np.arange(resolution, dtype=np.float64) / resolution)[None, :, None]
+    s = 1.0 - t
+    curve = s * s * s * p0 + 3.0 * s * s * t * p1 + 3.0 * s * t * t * p2 + t * t * t * p3
+
+    return np.concatenate([curve.reshape(-1, 3), points[ends[-1]][None, :]])
+
+
+def nurbs_polyline(points, weights, order, cyclic, use_endpoint, resolution):
+    """Evaluate a NURBS spline into a dense polyline with Cox-de Boor.
+
+    Uses a clamped knot vector for endpoint splines and a uniform one
+    otherwise, with `resolution` samples per knot span. Cyclic splines
+    wrap their first control points around.
+    """
+    order = max(min(order, len(points)), 2)
+    if len(points) < 2:
+        return points[:1].copy()
+
+    if cyclic:
+        points = np.concatenate([points, points[:order - 1]])
+        weights = np.concatenate([weights, weights[:order - 1]])
+
+    count = len(points)
+    degree = order - 1
+
+    if use_endpoint and not cyclic:
+        knots = np.concatenate([
+            np.zeros(degree),
+            np.arange(count - degree + 1, dtype=np.float64),
+            np.full(degree, count - degree, dtype=np.float64)
+        ])
+    else:
+        knots = np.arange(count + order, dtype=np.float64)
+
+    spans = count - degree
+    t = np.linspace(knots[degree], knots[count], spans * resolution + 1)
+
+    # Degree zero basis, the end of the domain belongs to the last span
+    basis = ((knots[None, :-1] <= t[:, None]) & (t[:, None] < knots[None, 1:])).astype(np.float64)
+    basis[-1, :] = 0.0
+    basis[-1, count - 1] = 1.0
+
+    for k in range(1, order):
+        left_den = knots[k:-1] - knots[:-k - 1]
+        right_den = knots[k + 1:] - knots[1:-k]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            left = np.where(left_den > 0.0, (t[:, None] - knots[None, :-k - 1]) / left_den, 0.0)
+            right = np.where(right_den > 0.0, (knots[None, k + 1:] - t[:, None]) / right_den, 0.0)
+        basis = left * basis[:, :-1] + right * basis[:, 1:]
+
+    weighted = basis * weights[None, :]
+    denominator = weighted.sum(axis=1)
+    denominator[denominator == 0.0] = 1.0
+    return (weighted @ points) / denominator[:, None]
+
+
+def arc_length_table(polyline):
+    """Cumulative arc lengths and unit segment tangents of a polyline"""
+    segments = np.diff(polyline, axis=0)
+    lengths = np.linalg.norm(segments, axis=1)
+
+    tangents = np.zeros_like(segments)
+    valid = lengths > 0.0
+    tangents[valid] = segments[valid] / lengths[valid, None]
+
+    cumulative = np.concatenate([[0.0], np.cumsum(lengths)])
+    return cumulative, tangents
+
+
+def sample_polyline(polyline, cumulative, tangents, count, rng):
+    """Pick `count` points uniformly by arc length along a polyline.
+
+    Every lookup is a single binary search into the cumulative length
+    table. Returns the points and the tangent of the segment they lie on.
+    """
+    if count <= 0 or len(tangents) == 0 or cumulative[-1] <= 0.0:
+        empty = np.empty((0, 3), dtype=np.float64)
+        return empty, empty.copy()
+
+    distances = rng.random(count) * cumulative[-1]
+    segment = np.searchsorted(cumulative, distances, side='right') - 1
+    np.clip(segment, 0, len(tangents) - 1, out=segment)
+
+    lengths = cumulative[segment + 1] - cumulative[segment]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.where(lengths > 0.0, (distances - cumulative[segment]) / lengths, 0.0)
+
+    start = polyline[segment]
+    points = start + (polyline[segment + 1] - start) * fraction[:, None]
+    return points, tangents[segment]
+
+
+def transform_directions(directions, matrix):
+    """Apply the rotation/scale part of a 4x4 matrix and renormalize"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    result = directions @ matrix[:3, :3].T
+
+    lengths = np.linalg.norm(result, axis=1)
+    valid = lengths > 0.0
+    result[valid] /= lengths[valid, None]
+    return result
+
+
+def weighted_cdf(areas, weights):
+    """Cumulative distribution of triangle areas scaled by per-triangle weights"""
+    return np.cumsum(areas * np.clip(weights, 0.0, None), dtype=np.float64)
+
+
+def vertex_weights_to_triangles(tris, vertex_weights):
+    """Average per-vertex weights over each triangle's corners"""
+    return vertex_weights[tris].mean(axis=1)
+
+
+def sample_image(pixels, uvs):
+    """Nearest-pixel grey value of an (H, W, C) image at repeating UVs"""
+    height, width = pixels.shape[:2]
+    x = np.floor(np.mod(uvs[:, 0], 1.0) * width).astype(np.int64) % width
+    y = np.floor(np.mod(uvs[:, 1], 1.0) * height).astype(np.int64) % height
+    channels = min(pixels.shape[2], 3)
+    return pixels[y, x, :channels].mean(axis=1)
+
+
+def image_weights_to_triangles(tri_loops, loop_uvs, pixels):
+    """Average an image over each triangle's corners and UV centroid"""
+    corner_uvs = loop_uvs[tri_loops]
+    samples = [sample_image(pixels, corner_uvs[:, corner]) for corner in range(3)]
+    samples.append(sample_image(pixels, corner_uvs.mean(axis=1)))
+    return np.mean(samples, axis=0)
+
+
+def axis_rotations(axis_index, angles):
+    """Rotation matrices about the X (0), Y (1) or Z (2) axis for each angle"""
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    matrices = np.zeros((len(angles), 3, 3), dtype=np.float64)
+
+    a, b = [index for index in range(3) if index != axis_index]
+    matrices[:, axis_index, axis_index] = 1.0
+    matrices[:, a, a] = cos
+    matrices[:, b, b] = cos
+    # Right-handed: the sign flips for the Y axis
+    if axis_index == 1:
+        matrices[:, a, b] = sin
+        matrices[:, b, a] = -sin
+    else:
+        matrices[:, a, b] = -sin
+        matrices[:, b, a] = sin
+    return matrices
+
+
+def align_rotations(axis, directions):
+    """Shortest-arc rotation matrices turning the unit `axis` onto each direction.
+
+    Zero directions give the identity, exactly opposite ones a half turn
+    about X (perpendicular to both the Y and Z axes used here).
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    count = len(directions)
+
+    lengths = np.linalg.norm(directions, axis=1)
+    unit = np.zeros_like(directions)
+    valid = lengths > 0.0
+    unit[valid] = directions[valid] / lengths[valid, None]
+
+    cross = np.cross(axis, unit)
+    dot = unit @ axis
+
+    skew = np.zeros((count, 3, 3), dtype=np.float64)
+    skew[:, 0, 1] = -cross[:, 2]
+    skew[:, 0, 2] = cross[:, 1]
+    skew[:, 1, 0] = cross[:, 2]
+    skew[:, 1, 2] = -cross[:, 0]
+    skew[:, 2, 0] = -cross[:, 1]
+    skew[:, 2, 1] = cross[:, 0]
+
+    opposite = dot < -1.0 + 1e-8
+    factor = np.where(opposite, 0.0, 1.0 / np.where(opposite, 1.0, 1.0 + dot))
+    matrices = np.eye(3)[None, :, :] + skew + (skew @ skew) * factor[:, None, None]
+
+    matrices[opposite] = np.diag((1.0, -1.0, -1.0))
+    matrices[~valid] = np.eye(3)
+    return matrices
+
+
+def euler_from_matrices(matrices):
+    """XYZ Euler angles (Blender's default order) for stacked rotation matrices"""
+    cy = np.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+    regular = cy > 1e-6
+
+    x = np.where(regular,
+                 np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2]),
+                 np.arctan2(-matrices[:, 1, 2], matrices[:, 1, 1]))
+    y = np.arctan2(-matrices[:, 2, 0], cy)
+    z = np.where(regular, np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]), 0.0)
+    return np.column_stack((x, y, z))
+
+
+def matrices_from_euler(eulers):
+    """Rotation matrices for stacked XYZ Euler angles, Rz @ Ry @ Rx"""
+    return axis_rotations(2, eulers[:, 2]) @ axis_rotations(1, eulers[:, 1]) @ axis_rotations(0, eulers[:, 0])
+
+
+def camera_visibility(points, view_projection, margin=0.0):
+    """Mask of points inside a camera frustum.
+
+    `view_projection` maps world space to clip space. `margin` widens the
+    frame by that fraction of its size on every side, so instances just
+    outside the view still cast shadows and reflections into it.
+    """
+    homogeneous = np.ones((len(points), 4), dtype=np.float64)
+    homogeneous[:, :3] = points
+    clip = homogeneous @ np.asarray(view_projection, dtype=np.float64).T
+
+    w = clip[:, 3]
+    in_front = w > 0.0
+    ndc = clip[:, :3] / np.where(in_front, w, 1.0)[:, None]
+
+    limit = 1.0 + 2.0 * margin
+    return (in_front
+            & (np.abs(ndc[:, 0]) <= limit)
+            & (np.abs(ndc[:, 1]) <= limit)
+            & (np.abs(ndc[:, 2]) <= 1.0))
+
+
+def occupancy_grid(verts, tris, resolution):
+    """Voxelize a closed triangle mesh into an inside/outside grid.
+
+    Casts one ray per grid column along +Z. Every ray is tested against
+    every triangle covering it in a single batch. A cell is inside when an
+    odd number of surface crossings lie below its center (ray parity).
+    Returns the boolean (nx, ny, nz) grid, its origin corner and cell size.
+    """
+    lo = verts.min(axis=0)
+    hi = verts.max(axis=0)
+    cell_size = float((hi - lo).max()) / resolution
+    if cell_size <= 0.0:
+        return np.zeros((1, 1, 1), dtype=bool), lo, 1.0
+    dims = np.maximum(np.ceil((hi - lo) / cell_size).astype(np.int64), 1)
+
+    # Nudge the rays off the grid lines so they don't hit edges and vertices exactly
+    jitter = np.array((0.3183099, 0.2718282)) * 1e-3 * cell_size
+
+    a = verts[tris[:, 0]]
+    b = verts[tris[:, 1]]
+    c = verts[tris[:, 2]]
+    tri_lo = np.minimum(np.minimum(a, b), c)[:, :2]
+    tri_hi = np.maximum(np.maximum(a, b), c)[:, :2]
+
+    # Range of column centers inside each triangle's XY bounds
+    first = np.ceil((tri_lo - lo[:2] - jitter) / cell_size - 0.5).astype(np.int64)
+    last = np.floor((tri_hi - lo[:2] - jitter) / cell_size - 0.5).astype(np.int64)
+    first = np.maximum(first, 0)
+    last = np.minimum(last, dims[:2] - 1)
+    spans = np.maximum(last - first + 1, 0)
+    pairs = spans[:, 0] * spans[:, 1]
+
+    # Expand into one (triangle, column) pair per candidate ray hit
+    tri_index = np.repeat(np.arange(len(tris)), pairs)
+    offsets = np.arange(len(tri_index)) - np.repeat(np.cumsum(pairs) - pairs, pairs)
+    column_i = first[tri_index, 0] + offsets // np.maximum(spans[tri_index, 1], 1)
+    column_j = first[tri_index, 1] + offsets % np.maximum(spans[tri_index, 1], 1)
+
+    x = lo[0] + (column_i + 0.5) * cell_size + jitter[0]
+    y = lo[1] + (column_j + 0.5) * cell_size + jitter[1]
+
+    # Barycentric coordinates of the ray in the triangle's XY projection
+    ta = a[tri_index]
+    tb = b[tri_index]
+    tc = c[tri_index]
+    det = (tb[:, 1] - tc[:, 1]) * (ta[:, 0] - tc[:, 0]) + (tc[:, 0] - tb[:, 0]) * (ta[:, 1] - tc[:, 1])
+    flat = np.abs(det) < 1e-20
+    det = np.where(flat, 1.0, det)
+    u = ((tb[:, 1] - tc[:, 1]) * (x - tc[:, 0]) + (tc[:, 0] - tb[:, 0]) * (y - tc[:, 1])) / det
+    v = ((tc[:, 1] - ta[:, 1]) * (x - tc[:, 0]) + (ta[:, 0] - tc[:, 0]) * (y - tc[:, 1])) / det
+    w = 1.0 - u - v
+    hit = ~flat & (u >= 0.0) & (v >= 0.0) & (w >= 0.0)
+
+    z = u[hit] * ta[hit, 2] + v[hit] * tb[hit, 2] + w[hit] * tc[hit, 2]
+
+    # Toggle parity at the first cell center above each crossing
+    level = np.clip(np.floor((z - lo[2]) / cell_size - 0.5).astype(np.int64) + 1, 0, dims[2])
+    crossings = np.zeros((dims[0], dims[1], dims[2] + 1), dtype=np.int32)
+    np.add.at(crossings, (column_i[hit], column_j[hit], level), 1)
+
+    inside = (np.cumsum(crossings, axis=2)[:, :, :-1] % 2) == 1
+    return inside, lo, cell_size
+
+
+def occupied_cells_sample(grid, origin, cell_size, count, rng):
+    """Uniform random points inside the occupied cells of a grid"""
+    cells = np.argwhere(grid)
+    if len(cells) == 0 or count <= 0:
+        return np.empty((0, 3), dtype=np.float64)
+    chosen = cells[rng.integers(0, len(cells), count)]
+    return origin + (chosen + rng.random((count, 3))) * cell_size
+
+
+# Candidates drawn from each random sub-stream. Fixed, so the placements for
+# a seed never depend on how the work is chunked or spread over processes
+RNG_BLOCK_SIZE = 4096
+
+# Sub-stream families spawned from an item's seed
+POSITION_STREAM = 0
+ATTRIBUTE_STREAM = 1
+POISSON_STREAM = 2
+
+
+def stream_rng(seed, *key):
+    """Generator for one sub-stream of an item's seed, independent of all other keys"""
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=key)))
+
+
+def _blocks(count):
+    """(block index, start, stop) of the fixed-size candidate blocks"""
+    for block, start in enumerate(range(0, count, RNG_BLOCK_SIZE)):
+        yield block, start, min(start + RNG_BLOCK_SIZE, count)
+
+
+def _split(points, directions=None, start_fraction=0.0):
+    """Cut candidates from a sequential sampler into fixed-size blocks"""
+    for block, start, stop in _blocks(len(points)):
+        fraction = start_fraction + (1.0 - start_fraction) * stop / len(points)
+        yield points[start:stop], None if directions is None else directions[start:stop], fraction
+
+
+# Share of a Poisson candidate generator's progress spent throwing darts
+POISSON_SHARE = 0.9
+
+
+def _poisson_progress(steps):
+    """Pass a Poisson sampler's progress on as empty blocks and return its points"""
+    empty = np.empty((0, 3), dtype=np.float64)
+    while True:
+        try:
+            fraction = next(steps)
+        except StopIteration as done:
+            return done.value
+        yield empty, None, POISSON_SHARE * fraction
+
+
+def _surface_candidates(job):
+    """Yield (points, normals, fraction done) blocks on the target surface, in world space"""
+    verts = job["verts"]
+    tris = job["tris"]
+    weights = job.get("weights")
+    matrix_world = job["matrix_world"]
+
+    # Masked-out triangles get no share of the distribution at all
+    cdf = job["cdf"]
+    if weights is not None:
+        cdf = weighted_cdf(job["areas"], weights)
+
+    # Calculate number of instances based on density and mesh area
+    count = int(float(cdf[-1]) * job["density"] * 10) if len(cdf) else 0
+
+    if job["distribution"] == 'POISSON':
+        # Blue-noise points spaced by min_distance in world space
+        steps = poisson_disk_surface(transform_points(verts, matrix_world), tris, job["min_distance"],
+                                     stream_rng(job["seed"], POISSON_STREAM), count, weights)
+        points, normals = yield from _poisson_progress(steps)
+        yield from _split(points, normals, start_fraction=POISSON_SHARE)
+        return
+
+    for block, start, stop in _blocks(count):
+        rng = stream_rng(job["seed"], POSITION_STREAM, block)
+        points, normals, _ = sample_triangles(verts, tris, job["normals"], cdf, stop - start, rng)
+        yield transform_points(points, matrix_world), transform_normals(normals, matrix_world), stop / count
+
+
+def _mesh_volume_candidates(job):
+    """Yield (points, None, fraction done) blocks inside a voxelized closed mesh, in world space"""
+    grid = job["volume_grid"]
+    origin = job["volume_origin"]
+    cell_size = job["volume_cell_size"]
+    matrix_world = np.asarray(job["matrix_world"], dtype=np.float64)
+
+    # Calculate number of instances based on density and the mesh's world volume
+    scale = abs(np.linalg.det(matrix_world[:3, :3]))
+    volume = np.count_nonzero(grid) * cell_size ** 3 * scale
+    count = int(volume * job["density"] * 5)
+
+    if job["distribution"] == 'POISSON':
+        rng = stream_rng(job["seed"], POISSON_STREAM)
+        cells = np.argwhere(grid)
+
+        def draw(size):
+            # Darts only land in occupied cells, spaced by min_distance in world space
+            chosen = cells[rng.integers(0, len(cells), size)]
+            return transform_points(origin + (chosen + rng.random((size, 3))) * cell_size, matrix_world)
+
+        pool = int(POISSON_VOLUME_OVERSAMPLE * volume / job["min_distance"] ** 3) + 1
+        pool = min(pool, POISSON_MAX_CANDIDATES)
+        points = yield from _poisson_progress(poisson_disk_darts(draw, pool, job["min_distance"], count))
+        yield from _split(points, start_fraction=POISSON_SHARE)
+        return
+
+    for block, start, stop in _blocks(count):
+        rng = stream_rng(job["seed"], POSITION_STREAM, block)
+        points = occupied_cells_sample(grid, origin, cell_size, stop - start, rng)
+        yield transform_points(points, matrix_world), None, stop / count
+
+
+def _volume_candidates(job):
+    """Yield (points, None, fraction done) blocks inside the volume box or mesh"""
+    if job.get("volume_grid") is not None:
+        yield from _mesh_volume_candidates(job)
+        return
+
+    size = np.asarray(job["volume_size"], dtype=np.float64)
+    center = np.asarray(job["volume_center"], dtype=np.float64)
+
+    # Calculate number of instances based on density and volume
+    count = int(size[0] * size[1] * size[2] * job["density"] * 5)
+
+    if job["distribution"] == 'POISSON':
+        # Blue-noise points spaced by min_distance across the box
+        rng = stream_rng(job["seed"], POISSON_STREAM)
+        points = yield from _poisson_progress(poisson_disk_box(size, job["min_distance"], rng, count))
+        yield from _split(points + center - size / 2, start_fraction=POISSON_SHARE)
+        return
+
+    for block, start, stop in _blocks(count):
+        rng = stream_rng(job["seed"], POSITION_STREAM, block)
+        yield rng.uniform(-size / 2, size / 2, (stop - start, 3)) + center, None, stop / count
+
+
+def _path_candidates(job):
+    """Yield (points, path directions, fraction done) blocks along every spline"""
+    matrix_world = job["matrix_world"]
+    offset = job["path_offset"]
+
+    # Calculate number of instances based on density and path length
+    counts = [int(float(cumulative[-1]) * job["density"] * 2) for _, cumulative, _ in job["splines"]]
+    total = max(sum(counts), 1)
+    done = 0
+
+    for spline_index, ((polyline, cumulative, tangents), count) in enumerate(zip(job["splines"], counts)):
+        for block, start, stop in _blocks(count):
+            rng = stream_rng(job["seed"], POSITION_STREAM, spline_index, block)
+
+            # Look every position up in the arc-length table at once
+            points, point_tangents = sample_polyline(polyline, cumulative, tangents, stop - start, rng)
+            points = transform_points(points, matrix_world)
+            directions = transform_directions(point_tangents, matrix_world)
+
+            if offset > 0 and len(points):
+                # Perpendicular vectors (in XY plane for simplicity)
+                perps = np.zeros_like(directions)
+                perps[:, 0] = -directions[:, 1]
+                perps[:, 1] = directions[:, 0]
+                lengths = np.linalg.norm(perps, axis=1)
+                valid = lengths > 0.0
+                perps[valid] /= lengths[valid, None]
+
+                points = points + perps * rng.uniform(-offset, offset, len(points))[:, None]
+
+            done += stop - start
+            yield points, directions, done / total
+
+
+def _item_rotations(job, directions, rng, count):
+    """Euler rotations for an item's instances"""
+    full_turn = 2.0 * math.pi
+    spin_min = math.radians(job["rotation_min"])
+    spin_max = math.radians(job["rotation_max"])
+
+    if job["method"] == 'VOLUME':
+        return np.column_stack((
+            rng.uniform(0.0, full_turn, count),
+            rng.uniform(0.0, full_turn, count),
+            rng.uniform(spin_min, spin_max, count)
+        ))
+
+    if not job["align_to_normal"]:
+        # Random rotation on all axes
+        return rng.uniform(0.0, full_turn, (count, 3))
+
+    # Surface instances stand along the normal, path instances face along the path
+    axis_index = 2 if job["method"] == 'SURFACE' else 1
+    axis = np.zeros(3)
+    axis[axis_index] = 1.0
+
+    align = align_rotations(axis, directions)
+    spin = axis_rotations(axis_index, rng.uniform(spin_min, spin_max, count))
+    return euler_from_matrices(align @ spin)
+
+
+def item_transform_steps(job, chunk_size=2000):
+    """Generate one scatter item's transforms from plain data.
+
+    `job` is a dict of item settings plus the method's source buffers, as
+    built by the ScatterCraft operator. Yields progress fractions between
+    blocks and returns (locations, rotations, scales, lods) arrays, where
+    `lods` flags the instances that use the item's proxy.
+
+    Every RNG_BLOCK_SIZE candidates draw positions, rotations and scales
+    from their own sub-streams of the item's seed, so a seed gives
+    bit-identical results however the blocks are scheduled.
+    """
+    if job["method"] == 'SURFACE':
+        candidates = _surface_candidates(job)
+    elif job["method"] == 'VOLUME':
+        candidates = _volume_candidates(job)
+    else:
+        candidates = _path_candidates(job)
+
+    blocks = []
+    for points, directions, fraction in candidates:
+        if len(points) == 0:
+            # Progress from a sampler that's still working, not a block
+            yield 0.5 * fraction
+            continue
+
+        rng = stream_rng(job["seed"], ATTRIBUTE_STREAM, len(blocks))
+        count = len(points)
+        rotations = _item_rotations(job, directions, rng, count)
+        scales = rng.uniform(job["scale_min"], job["scale_max"], count)
+        blocks.append((points, rotations, scales))
+        yield 0.5 * fraction
+
+    if blocks:
+        points, rotations, scales = (np.concatenate(column) for column in zip(*blocks))
+    else:
+        points = np.empty((0, 3), dtype=np.float64)
+        rotations = np.empty((0, 3), dtype=np.float64)
+        scales = np.empty(0, dtype=np.float64)
+
+    # Drop what the camera can't see before spending time on overlaps
+    camera = job.get("camera")
+    if camera and camera["cull"] and len(points):
+        visible = camera_visibility(points, camera["view_projection"], camera["margin"])
+        points, rotations, scales = points[visible], rotations[visible], scales[visible]
+
+    # Check for overlap against neighbouring grid cells only
+    if job["avoid_overlap"] and len(points):
+        grid = SpatialHashGrid(job["min_distance"])
+        keep = []
+        for index, point in enumerate(points.tolist()):
+            if index and index % chunk_size == 0:
+                yield 0.5 + 0.5 * index / len(points)
+            if grid.try_insert(point):
+                keep.append(index)
+
+        points, rotations, scales = points[keep], rotations[keep], scales[keep]
+
+    # Instances beyond the LOD distance switch to the item's proxy
+    lods = np.zeros(len(points), dtype=bool)
+    if camera and job["use_proxy"] and camera["lod_distance"] is not None:
+        distances = np.linalg.norm(points - np.asarray(camera["location"]), axis=1)
+        lods = distances > camera["lod_distance"]
+
+    return points, rotations, scales, lods
+
+
+def generate_item_transforms(job):
+    """Run item_transform_steps to completion"""
+    steps = item_transform_steps(job)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+# Source buffers of the current run, handed to each pool worker once
+_worker_sources = {}
+
+
+def init_worker(sources):
+    """Process pool initializer, keeps the shared source buffers for every job"""
+    _worker_sources.clear()
+    _worker_sources.update(sources)
+
+
+def generate_worker_transforms(settings):
+    """Process pool entry point, runs one item's settings against the worker's sources"""
+    return generate_item_transforms(dict(_worker_sources, **settings))
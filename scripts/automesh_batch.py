@@ -0,0 +1,335 @@
+"""
+Headless AutoMesh Pro batch processor.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python scripts/automesh_batch.py -- --input drops/ --output processed/ --workers 8
+
+Applies an AutoMesh recipe to every .blend, .obj and .fbx file in the
+input directory. Each file is processed by its own background Blender
+subprocess, --workers of them at a time. Finished files are appended to
+automesh_progress.jsonl in the output directory, so an interrupted run
+picks up where it stopped when started again with the same recipe.
+A JSON report of every file, stage and failure is written at the end.
+
+A recipe is a JSON file such as:
+
+    {
+        "stages": ["optimize", "cleanup", "unwrap", "export"],
+        "settings": {"triangulate": true, "unwrap_method": "SMART", "export_format": "FBX"}
+    }
+
+Stages run in order on the file's meshes: "remesh" and "optimize" replace
+them with processed copies, "cleanup" and "unwrap" work in place,
+"export" writes the meshes to one file per input and "save" writes a
+.blend, both named after the input with its extension (a.obj exports to
+a_obj.fbx). "settings" are AutoMesh Pro panel properties.
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import bpy
+except ImportError:
+    # The coordinator also runs under plain Python, given --blender
+    bpy = None
+
+# Import the add-on straight from this checkout
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+INPUT_EXTENSIONS = (".blend", ".obj", ".fbx")
+
+DEFAULT_RECIPE = {
+    "stages": ["cleanup", "unwrap", "export"],
+    "settings": {}
+}
+
+# AutoMesh operator per mesh-processing stage
+STAGE_OPERATORS = {
+    "remesh": "apply_remesh",
+    "optimize": "auto_optimize_mesh",
+    "cleanup": "apply_cleanup",
+    "unwrap": "apply_unwrap"
+}
+
+STAGES = set(STAGE_OPERATORS) | {"export", "save"}
+
+PROGRESS_FILE = "automesh_progress.jsonl"
+REPORT_FILE = "automesh_report.json"
+
+def parse_args():
+    """Parse the arguments after Blender's `--` separator"""
+    if bpy is not None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    else:
+        argv = sys.argv[1:]
+    
+    parser = argparse.ArgumentParser(description="Apply an AutoMesh Pro recipe to a directory of meshes")
+    parser.add_argument("--input", help="Directory of .blend, .obj and .fbx files")
+    parser.add_argument("--output", help="Directory for processed files, progress and the report")
+    parser.add_argument("--recipe", help="Recipe JSON file (default: cleanup, unwrap, export)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Blender processes run at once")
+    parser.add_argument("--recursive", action="store_true", help="Include files in subdirectories")
+    parser.add_argument("--timeout", type=float, help="Seconds before a file's Blender process is killed")
+    parser.add_argument("--retry-failed", action="store_true", help="Process files that failed in an earlier run again")
+    parser.add_argument("--report", help=f"Report path (default: OUTPUT/{REPORT_FILE})")
+    parser.add_argument("--blender", help="Blender executable for the workers (default: the running one)")
+    
+    # Internal: one worker process per file
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    parser.add_argument("--export-path", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    
+    args = parser.parse_args(argv)
+    if not args.worker and not (args.input and args.output):
+        parser.error("--input and --output are required")
+    return args
+
+def load_recipe(path):
+    """Read and check a recipe, filling in the defaults"""
+    recipe = dict(DEFAULT_RECIPE)
+    if path:
+        with open(path) as f:
+            recipe.update(json.load(f))
+    
+    unknown = [stage for stage in recipe["stages"] if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown recipe stages: {', '.join(unknown)}")
+    return recipe
+
+def find_inputs(directory, recursive):
+    """Input files under `directory`, sorted so runs are repeatable"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(INPUT_EXTENSIONS))
+        if not recursive:
+            break
+    return sorted(paths)
+
+def file_key(path, recipe):
+    """Identify a file's contents and recipe, so edits to either rerun it"""
+    stat = os.stat(path)
+    text = json.dumps([os.path.abspath(path), stat.st_size, stat.st_mtime_ns, recipe], sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+def output_stem(path, input_dir, output_dir):
+    """Output path without extension, mirroring the input's subdirectory.
+    
+    The input's extension stays in the name, so a.obj and a.fbx next to
+    each other write a_obj.* and a_fbx.* instead of overwriting each other.
+    """
+    root, extension = os.path.splitext(os.path.relpath(path, input_dir))
+    return os.path.join(output_dir, f"{root}_{extension[1:].lower()}")
+
+def read_progress(path):
+    """Records of files finished by earlier runs, by key"""
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A run killed mid-write leaves a partial last line
+                continue
+            done[record["key"]] = record
+    return done
+
+def run_worker_process(blender, recipe_path, path, stem, result_path, timeout):
+    """Process one file in a background Blender, returning its record"""
+    command = [
+        blender, "-b", "--factory-startup", "--python", os.path.abspath(__file__), "--",
+        "--worker", "--recipe", recipe_path, "--file", path, "--export-path", stem, "--result", result_path
+    ]
+    
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return dict(file=path, status="failed", error=f"Timed out after {timeout}s", seconds=time.perf_counter() - started)
+    
+    if os.path.exists(result_path):
+        with open(result_path) as f:
+            record = json.load(f)
+        os.remove(result_path)
+    else:
+        # Blender crashed or the script failed before writing a result
+        tail = (completed.stderr or completed.stdout).strip().splitlines()[-5:]
+        record = dict(file=path, status="failed", error=f"Blender exited with code {completed.returncode}", log=tail)
+    
+    record["seconds"] = time.perf_counter() - started
+    return record
+
+def coordinate(args):
+    """Run every input file through a pool of Blender processes"""
+    recipe = load_recipe(args.recipe)
+    os.makedirs(args.output, exist_ok=True)
+    
+    # Workers read the resolved recipe, the report records it
+    recipe_path = os.path.join(args.output, "automesh_recipe.json")
+    with open(recipe_path, "w") as f:
+        json.dump(recipe, f, indent=2)
+    
+    blender = args.blender or (bpy.app.binary_path if bpy is not None else "blender")
+    results_dir = os.path.join(args.output, ".automesh_results")
+    os.makedirs(results_dir, exist_ok=True)
+    
+    progress_path = os.path.join(args.output, PROGRESS_FILE)
+    done = read_progress(progress_path)
+    
+    records = []
+    pending = []
+    for index, path in enumerate(find_inputs(args.input, args.recursive)):
+        key = file_key(path, recipe)
+        previous = done.get(key)
+        if previous and (previous["status"] == "ok" or not args.retry_failed):
+            records.append(dict(previous, resumed=True))
+        else:
+            pending.append((key, path, os.path.join(results_dir, f"{index}.json")))
+    
+    print(f"{len(pending)} file(s) to process, {len(records)} already done, {args.workers} worker(s)", file=sys.stderr)
+    
+    started = time.perf_counter()
+    with open(progress_path, "a") as progress, ThreadPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        futures = {
+            pool.submit(run_worker_process, blender, recipe_path, path,
+                        output_stem(path, args.input, args.output), result_path, args.timeout): key
+            for key, path, result_path in pending
+        }
+        for finished, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            record["key"] = futures[future]
+            records.append(record)
+            
+            # Append as soon as a file is done so an interrupted run can resume
+            progress.write(json.dumps(record) + "\n")
+            progress.flush()
+            print(f"[{finished}/{len(pending)}] {record['status']:6} {record['file']} ({record['seconds']:.1f}s)", file=sys.stderr)
+    
+    records.sort(key=lambda record: record["file"])
+    report = {
+        "blender": blender,
+        "recipe": recipe,
+        "input": os.path.abspath(args.input),
+        "output": os.path.abspath(args.output),
+        "workers": args.workers,
+        "seconds": time.perf_counter() - started,
+        "processed": len(pending),
+        "ok": sum(record["status"] == "ok" for record in records),
+        "partial": sum(record["status"] == "partial" for record in records),
+        "failed": sum(record["status"] == "failed" for record in records),
+        "files": records
+    }
+    
+    report_path = args.report or os.path.join(args.output, REPORT_FILE)
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {report_path}", file=sys.stderr)
+    return 1 if report["failed"] or report["partial"] else 0
+
+def load_input(path):
+    """Open or import one input file, returning its mesh objects"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".blend":
+        bpy.ops.wm.open_mainfile(filepath=path)
+        return [obj for obj in bpy.context.view_layer.objects if obj.type == 'MESH']
+    
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    if extension == ".obj" and hasattr(bpy.types, "WM_OT_obj_import"):
+        bpy.ops.wm.obj_import(filepath=path)
+    elif extension == ".obj":
+        bpy.ops.import_scene.obj(filepath=path)
+    else:
+        bpy.ops.import_scene.fbx(filepath=path)
+    return [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
+
+def run_stages(recipe, objects, export_path):
+    """Apply the recipe's stages to `objects`, returning one record per stage"""
+    from kodelabz_toolkit.tools import auto_mesh_pro
+    
+    context = bpy.context
+    props = context.scene.kdlz_automesh_props
+    for name, value in recipe["settings"].items():
+        if name not in props.bl_rna.properties:
+            raise ValueError(f"Unknown AutoMesh setting '{name}'")
+        setattr(props, name, value)
+    
+    # Every stage acts on the current selection
+    props.batch_target = 'SELECTED'
+    auto_mesh_pro.select_only(context, objects)
+    
+    stages = []
+    for stage in recipe["stages"]:
+        started = time.perf_counter()
+        record = dict(stage=stage)
+        
+        if stage in STAGE_OPERATORS:
+            auto_mesh_pro.last_batch_report.update(label="", done=0, timings=[], failures=[], shared=0.0)
+            getattr(bpy.ops.kdlz, STAGE_OPERATORS[stage])()
+            report = auto_mesh_pro.last_batch_report
+            record.update(
+                done=report["done"],
+                objects={name: seconds for name, seconds in report["timings"]},
+                failures={name: message for name, message in report["failures"]}
+            )
+            
+            # Copying stages leave their results selected
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        elif stage == "export":
+            record["path"] = export_path + "." + props.export_format.lower()
+            os.makedirs(os.path.dirname(record["path"]), exist_ok=True)
+            auto_mesh_pro.export_objects(context, objects, record["path"], props)
+        elif stage == "save":
+            record["path"] = export_path + ".blend"
+            os.makedirs(os.path.dirname(record["path"]), exist_ok=True)
+            bpy.ops.wm.save_as_mainfile(filepath=record["path"], copy=True)
+        
+        record["seconds"] = time.perf_counter() - started
+        stages.append(record)
+        
+        if not objects:
+            raise RuntimeError(f"No meshes left after the {stage} stage")
+    return stages
+
+def work(args):
+    """Worker process: apply the recipe to one file and write its record"""
+    import kodelabz_toolkit
+    
+    record = dict(file=args.file, status="ok")
+    try:
+        recipe = load_recipe(args.recipe)
+        objects = load_input(args.file)
+        if not hasattr(bpy.types.Scene, "kdlz_automesh_props"):
+            kodelabz_toolkit.register()
+        
+        record["meshes"] = len(objects)
+        if not objects:
+            raise RuntimeError("File has no mesh objects")
+        record["stages"] = run_stages(recipe, objects, args.export_path)
+        
+        if any(stage.get("failures") for stage in record["stages"]):
+            record["status"] = "partial"
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+    
+    with open(args.result, "w") as f:
+        json.dump(record, f)
+
+def main():
+    args = parse_args()
+    if args.worker:
+        work(args)
+    else:
+        sys.exit(coordinate(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+AutoMesh Pro's bpy-free mesh analysis, runs under plain pytest.
+"""
+import numpy as np
+
+from kodelabz_toolkit.tools.mesh_analysis import analyze_mesh, coincident_vertex_count, connected_components
+
+# Outward-facing quads of a unit cube with corners numbered as binary xyz
+CUBE_FACES = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+
+
+def cube(offset):
+    corners = np.array([(i >> 2 & 1, i >> 1 & 1, i & 1) for i in range(8)], dtype=np.float64)
+    return corners[:, ::-1] + offset, CUBE_FACES
+
+
+def mesh_buffers(verts, faces):
+    """analyze_mesh arguments for polygons given as vertex index tuples, like Mesh.from_pydata builds"""
+    edge_index = {}
+    loop_verts = []
+    loop_edges = []
+    for face in faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            key = (min(a, b), max(a, b))
+            loop_verts.append(a)
+            loop_edges.append(edge_index.setdefault(key, len(edge_index)))
+
+    edges = np.array(list(edge_index), dtype=np.int64).reshape(-1, 2)
+    loop_totals = np.array([len(face) for face in faces], dtype=np.int64)
+    loop_starts = np.cumsum(loop_totals) - loop_totals
+    return (np.asarray(verts, dtype=np.float64), edges, loop_starts, loop_totals,
+            np.array(loop_verts, dtype=np.int64), np.array(loop_edges, dtype=np.int64))
+
+
+def two_cubes():
+    """Unit cubes touching at one corner, each with its own copy of that vertex"""
+    verts_a, faces_a = cube(0.0)
+    verts_b, faces_b = cube(1.0)
+    faces = faces_a + [tuple(index + 8 for index in face) for face in faces_b]
+    return np.concatenate((verts_a, verts_b)), faces
+
+
+def test_two_cubes_sharing_a_corner():
+    verts, faces = two_cubes()
+    buffers = mesh_buffers(verts, faces)
+
+    assert coincident_vertex_count(verts, 0.001) == 1
+    labels = connected_components(len(verts), buffers[1])
+    assert len(np.unique(labels)) == 2
+
+    report = analyze_mesh(*buffers)
+    assert report["watertight"] and not report["inside_out"]
+    assert report["loose_parts"] == 2
+    assert report["flipped_edges"] == 0
+    assert np.isclose(report["volume"], 2.0)
+    assert np.isclose(report["area"], 12.0)
+
+
+def test_close_vertices_across_cell_borders():
+    # Pairs straddling grid cell corners, which snapping to a grid misses
+    base = np.array([(0.0, 0.0, 0.0), (5.0, 5.0, 5.0), (9.0, 0.0, 3.0)])
+    verts = np.concatenate((base - 0.0004, base + 0.0004, base + (3.0, 0.0, 0.0)))
+    assert coincident_vertex_count(verts, 0.002) == 3
+    assert coincident_vertex_count(verts, 0.001) == 0
+
+
+def test_open_quad():
+    verts = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+    report = analyze_mesh(*mesh_buffers(verts, [(0, 1, 2, 3)]))
+
+    assert not report["watertight"]
+    assert report["non_manifold_edges"] == report["boundary_edges"] == 4
+    assert report["boundary_loops"] == 1
+    # Open meshes enclose nothing, no volume is reported
+    assert report["volume"] is None
+    assert np.isclose(report["area"], 1.0)
+    assert coincident_vertex_count(np.asarray(verts), 0.001) == 0
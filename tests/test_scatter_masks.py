@@ -0,0 +1,69 @@
+"""
+Density masks of items saved without a uid.
+
+Needs Blender's Python, run from the repository root with:
+
+    blender -b --factory-startup --python-expr "import pytest, sys; sys.exit(pytest.main(['tests']))"
+"""
+import os
+import sys
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+# Import the add-on straight from this checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kodelabz_toolkit
+from kodelabz_toolkit.tools import scatter_craft
+
+# Grid cell size, triangles on the x = 0 seam blend both groups
+PLANE_SIZE = 10.0
+SUBDIVISIONS = 20
+SEAM = PLANE_SIZE / SUBDIVISIONS
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    if not hasattr(bpy.types.Scene, "kdlz_scatter_props"):
+        kodelabz_toolkit.register()
+
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=SUBDIVISIONS, y_subdivisions=SUBDIVISIONS, size=PLANE_SIZE)
+    target = bpy.context.active_object
+    left = target.vertex_groups.new(name="Left")
+    right = target.vertex_groups.new(name="Right")
+    left.add([v.index for v in target.data.vertices if v.co.x <= 0.0], 1.0, 'REPLACE')
+    right.add([v.index for v in target.data.vertices if v.co.x >= 0.0], 1.0, 'REPLACE')
+
+    bpy.ops.mesh.primitive_cube_add(size=0.1)
+    source = bpy.context.active_object
+
+    scene = bpy.context.scene
+    props = scene.kdlz_scatter_props
+    props.target_object = target.name
+    props.avoid_overlap = False
+    for group in ("Left", "Right"):
+        item = props.scatter_items.add()
+        item.object = source
+        item.density = 1.0
+        item.mask_type = 'VERTEX_GROUP'
+        item.mask_vertex_group = group
+        # Files saved before uids existed load with an empty one
+        item.uid = ""
+    return scene
+
+
+def test_masks_follow_items_without_uid(scene):
+    props = scene.kdlz_scatter_props
+    results = scatter_craft.compute_scatter_preview(bpy.context)
+
+    uids = [item.uid for item in props.scatter_items]
+    assert all(uids) and len(set(uids)) == 2
+
+    by_uid = {uid: locations for uid, locations, rotations, scales in results}
+    left, right = by_uid[uids[0]], by_uid[uids[1]]
+    assert len(left) and len(right)
+    assert (left[:, 0] <= SEAM).all()
+    assert (right[:, 0] >= -SEAM).all()
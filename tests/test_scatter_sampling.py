@@ -0,0 +1,110 @@
+"""
+ScatterCraft's bpy-free sampling helpers, runs under plain pytest.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from kodelabz_toolkit.tools.scatter_sampling import (
+    RNG_BLOCK_SIZE, generate_item_transforms, generate_worker_transforms, init_worker, item_transform_steps,
+    merge_surface_targets
+)
+
+
+def grid_plane(segments, size):
+    """Local (verts, tris) of a square plane split into segments x segments quads"""
+    steps = np.linspace(-size / 2, size / 2, segments + 1)
+    xs, ys = np.meshgrid(steps, steps)
+    verts = np.column_stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)))
+
+    index = np.arange(verts.shape[0]).reshape(segments + 1, segments + 1)
+    a, b = index[:-1, :-1].ravel(), index[:-1, 1:].ravel()
+    c, d = index[1:, 1:].ravel(), index[1:, :-1].ravel()
+    tris = np.concatenate((np.column_stack((a, b, c)), np.column_stack((a, c, d))))
+    return verts, tris
+
+
+def translation(x, y, z, scale=(1.0, 1.0, 1.0)):
+    matrix = np.diag(tuple(scale) + (1.0,))
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+
+def surface_job(parts, **settings):
+    """Job dict of a SURFACE item over world-space merged targets, as the operator builds it"""
+    verts, tris, areas, normals, cdf = merge_surface_targets(parts)
+    job = dict(
+        method='SURFACE', verts=verts, tris=tris, areas=areas, normals=normals, cdf=cdf,
+        matrix_world=np.identity(4), camera=None, distribution='RANDOM', avoid_overlap=False,
+        min_distance=0.5, seed=7, density=1.0, scale_min=0.5, scale_max=1.5,
+        rotation_min=0.0, rotation_max=360.0, align_to_normal=True, use_proxy=False, weights=None
+    )
+    job.update(settings)
+    return job
+
+
+def drain(steps):
+    """Run a step generator to completion and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def assert_same_transforms(first, second):
+    for a, b in zip(first, second):
+        assert a.dtype == b.dtype and np.array_equal(a, b)
+
+
+def test_scaled_target_counts_the_same_alone_and_in_a_list():
+    plane = grid_plane(4, 2.0)
+    scaled = (plane, translation(0.0, 0.0, 0.0, scale=(3.0, 0.5, 1.0)))
+    other = (grid_plane(2, 1.0), translation(10.0, 0.0, 0.0))
+
+    alone = surface_job([scaled])
+    listed = surface_job([scaled, other])
+
+    # The scaled plane weighs its 6 x 1 world area either way
+    own_triangles = len(plane[1])
+    assert np.isclose(alone["cdf"][-1], 6.0)
+    assert np.isclose(listed["areas"][:own_triangles].sum(), alone["cdf"][-1])
+
+    # Ten instances per unit of density and area, spread over the scaled extent
+    points = generate_item_transforms(alone)[0]
+    assert len(points) == 60
+    assert len(generate_item_transforms(listed)[0]) == 70
+    assert np.all(np.abs(points[:, 0]) <= 3.0) and np.all(np.abs(points[:, 1]) <= 0.5)
+
+
+@pytest.mark.parametrize("settings", [
+    dict(),
+    dict(avoid_overlap=True, min_distance=0.05),
+    dict(distribution='POISSON', min_distance=0.05),
+])
+def test_same_seed_is_bit_identical_across_chunk_sizes(settings):
+    job = surface_job([(grid_plane(8, 2.0), translation(0.0, 0.0, 0.0, scale=(15.0, 15.0, 1.0)))], **settings)
+    expected = generate_item_transforms(job)
+
+    # Enough instances for several RNG blocks
+    assert len(expected[0]) > RNG_BLOCK_SIZE
+
+    for chunk_size in (1, 7, 997, 100000):
+        assert_same_transforms(drain(item_transform_steps(job, chunk_size)), expected)
+
+
+def test_same_seed_is_bit_identical_across_worker_counts():
+    parts = [(grid_plane(8, 2.0), translation(0.0, 0.0, 0.0, scale=(15.0, 15.0, 1.0)))]
+    shared = surface_job(parts)
+    settings = [dict(seed=seed, density=density) for seed, density in ((1, 1.0), (2, 0.5), (3, 2.0))]
+    expected = [generate_item_transforms(dict(shared, **item)) for item in settings]
+
+    for workers in (1, 3):
+        # Same setup as the operator: spawned workers, sources handed over once
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=init_worker, initargs=(shared,)) as pool:
+            results = list(pool.map(generate_worker_transforms, settings))
+        for result, reference in zip(results, expected):
+            assert_same_transforms(result, reference)